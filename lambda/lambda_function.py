@@ -1,35 +1,137 @@
-import json
 import boto3
+import orjson
 import os
+import re
 import calendar
-from datetime import datetime, timedelta
+import gzip
+import hashlib
+import heapq
+import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor, Cm, Twips
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.table import WD_TABLE_ALIGNMENT, WD_CELL_VERTICAL_ALIGNMENT
+from docx.table import _Cell
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.section import WD_ORIENT
-from docx.oxml.ns import qn, nsmap
-from docx.oxml import OxmlElement
+from docx.oxml.ns import qn, nsmap, nsdecls
+from docx.oxml import OxmlElement, parse_xml
 import base64
 from io import BytesIO
-
-# Import matplotlib for chart generation
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for Lambda
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.ticker import MaxNLocator
+from tempfile import SpooledTemporaryFile
+from xml.sax.saxutils import escape
 
 # Constants
 MAX_DAILY_DISPLAY_DAYS = 15  # Maximum days to show in daily breakdown table
 DEFAULT_DAILY_BUDGET = 100.0  # Default daily budget in USD
 CHART_DPI = 150  # DPI for chart images
 ANALYSIS_DAYS = 14  # Number of days to analyze for trends
+CE_MAX_WORKERS = 2  # Concurrent Cost Explorer requests per report
+CE_CLIENT_CACHE_SIZE = 8  # Cost Explorer clients kept warm across invocations
+ROLE_CREDENTIAL_REFRESH_SECONDS = 300  # Re-assume roles this long before their credentials expire
+REPORT_SPOOL_MAX_BYTES = 16 * 1024 * 1024  # Reports larger than this spill to /tmp
+BASE64_CHUNK_BYTES = 57 * 1024  # Multiple of 3, so chunks encode without padding
+INLINE_REPORT_MAX_BYTES = 3 * 1024 * 1024  # Larger reports are served from S3 (API Gateway caps at 6MB)
+REPORT_URL_EXPIRY_SECONDS = 900  # Lifetime of pre-signed report download links
+DOCX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+ZERO_AMOUNTS = frozenset(('0', '0.0', '0.0000000000'))  # Cost Explorer zero amount strings
+
+# Report color palette - RGBColor values are immutable, so shared instances
+# are reused instead of being rebuilt for every run
+COLOR_NAVY = RGBColor(0, 51, 102)
+COLOR_DARK_RED = RGBColor(153, 0, 0)
+COLOR_DARK_GRAY = RGBColor(51, 51, 51)
+COLOR_MID_GRAY = RGBColor(102, 102, 102)
+COLOR_TEAL = RGBColor(0, 102, 153)
+COLOR_CHARCOAL = RGBColor(68, 68, 68)
+COLOR_BRIGHT_RED = RGBColor(204, 0, 0)
+COLOR_LIGHT_GRAY = RGBColor(180, 180, 180)
+COLOR_SOFT_GRAY = RGBColor(128, 128, 128)
+COLOR_BURNT_ORANGE = RGBColor(153, 76, 0)
+COLOR_INFO_BG = RGBColor(232, 245, 253)
+COLOR_ALERT_BG = RGBColor(255, 235, 235)
+COLOR_WARNING_BG = RGBColor(255, 240, 230)
+
+# Lengths applied inside per-item loops - like the colors, Length values are
+# immutable, so one instance serves every paragraph or cell
+INDENT_ITEM = Inches(0.25)
+INDENT_SUB_ITEM = Inches(0.5)
+SPACE_AFTER_SUB_ITEM = Pt(2)
+METRICS_COLUMN_WIDTH = Inches(1.5)
+
+# Decorative strings reused on every cover page and table of contents entry
+COVER_RULE = '━' * 30
+TOC_LEADER = '  ' + '.' * 60 + '  '
+
+# Response headers - the allowed origin is fixed for the life of the container,
+# so the header sets are built once at import
+ALLOWED_ORIGIN = os.environ.get('ALLOWED_ORIGIN', '*')
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': ALLOWED_ORIGIN,
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS'
+}
+JSON_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': ALLOWED_ORIGIN
+}
 
 # Template path - located in the same directory as this script
 TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'template.docx')
 
+# Paragraph markup written by fill_cell - matches what cell.text plus the cell styling
+# produce (4pt spacing before/after, Calibri run), built as one XML fragment
+CELL_PARAGRAPH_XML = (
+    '<w:p{ns}><w:pPr><w:spacing w:before="80" w:after="80"/><w:jc w:val="{align}"/></w:pPr>'
+    '<w:r><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri"/>{bold}{color}'
+    '<w:sz w:val="{size}"/></w:rPr>{text}</w:r></w:p>'
+)
+
+# Table cell markup written by append_table_rows, with the same cell properties
+# fill_cell sets on a cell created by doc.add_table
+CELL_XML = (
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/><w:vAlign w:val="center"/>'
+    '{shading}</w:tcPr>{paragraph}</w:tc>'
+)
+TABLE_ROWS_XML = '<w:tbl %s>{rows}</w:tbl>' % nsdecls('w')
+
+# Shaded single-cell box written by add_box - matches doc.add_table(rows=1, cols=1)
+# with 12pt padding above and below and 0.15" side indents
+BOX_XML = (
+    '<w:tbl %s><w:tblPr><w:tblW w:type="auto" w:w="0"/><w:jc w:val="center"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+    'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    '<w:tblGrid><w:gridCol w:w="{width}"/></w:tblGrid>'
+    '<w:tr><w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/><w:shd w:fill="{fill}"/></w:tcPr>'
+    '<w:p><w:pPr><w:spacing w:before="240"/><w:ind w:left="216" w:right="216"/></w:pPr>'
+    '<w:r><w:rPr><w:b/><w:color w:val="{title_color}"/><w:sz w:val="{title_size}"/></w:rPr>'
+    '{title}</w:r></w:p>'
+    '<w:p><w:pPr><w:spacing w:before="160" w:after="240"/><w:ind w:left="216" w:right="216"/></w:pPr>'
+    '{content}</w:p></w:tc></w:tr></w:tbl>'
+) % nsdecls('w')
+
+# Wrapper for parsing several body-level elements in one call
+BODY_XML = '<w:body %s>{content}</w:body>' % nsdecls('w')
+
+# Table border sets, parsed once and copied into each table that uses them
+TABLE_BORDERS_XML = (
+    '<w:tblBorders %s>' % nsdecls('w')
+    + ''.join(f'<w:{side} w:val="single" w:sz="{{size}}" w:color="{{color}}"/>'
+              for side in ('top', 'left', 'bottom', 'right', 'insideH', 'insideV'))
+    + '</w:tblBorders>'
+)
+DATA_TABLE_BORDERS = parse_xml(TABLE_BORDERS_XML.format(size=4, color='CCCCCC'))
+INLINE_TABLE_BORDERS = parse_xml(TABLE_BORDERS_XML.format(size=2, color='DDDDDD'))
+
+# Run content that python-docx writes as elements rather than <w:t> text
+RUN_CONTENT_SPLIT = re.compile(r'([\t\n\r])')
+RUN_CONTENT_XML = {'\t': '<w:tab/>', '\n': '<w:br/>', '\r': '<w:br/>'}
+
 
 def lambda_handler(event, context):
     """
@@ -39,31 +141,22 @@ def lambda_handler(event, context):
     when the DAILY budget threshold ($100/day) has been exceeded.
     Includes trend analysis, cost drivers, and embedded charts.
     """
-    allowed_origin = os.environ.get('ALLOWED_ORIGIN', '*')
-    
     # Handle CORS preflight
     if event.get('requestContext', {}).get('http', {}).get('method') == 'OPTIONS':
         return {
             'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': allowed_origin,
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS'
-            },
+            'headers': CORS_HEADERS,
             'body': ''
         }
     
     # Parse and validate request body
     try:
-        body = json.loads(event.get('body', '{}'))
-    except json.JSONDecodeError:
+        body = orjson.loads(event.get('body', '{}'))
+    except orjson.JSONDecodeError:
         return {
             'statusCode': 400,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': allowed_origin
-            },
-            'body': json.dumps({'error': 'Invalid JSON in request body'})
+            'headers': JSON_HEADERS,
+            'body': orjson.dumps({'error': 'Invalid JSON in request body'}).decode()
         }
     
     # Daily budget amount (default $100)
@@ -74,11 +167,8 @@ def lambda_handler(event, context):
     except (TypeError, ValueError):
         return {
             'statusCode': 400,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': allowed_origin
-            },
-            'body': json.dumps({'error': 'Invalid dailyBudget. Must be a positive number.'})
+            'headers': JSON_HEADERS,
+            'body': orjson.dumps({'error': 'Invalid dailyBudget. Must be a positive number.'}).decode()
         }
     
     # Parse and validate breach_date before authentication to fail fast
@@ -89,161 +179,168 @@ def lambda_handler(event, context):
     except ValueError:
         return {
             'statusCode': 400,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': allowed_origin
-            },
-            'body': json.dumps({'error': 'Invalid breachDate format. Expected YYYY-MM-DD.'})
+            'headers': JSON_HEADERS,
+            'body': orjson.dumps({'error': 'Invalid breachDate format. Expected YYYY-MM-DD.'}).decode()
         }
     
     # Authentication
     try:
         if 'roleArn' in body:
-            sts = boto3.client('sts')
-            assumed_role = sts.assume_role(
-                RoleArn=body['roleArn'],
-                RoleSessionName='ExamOnlineBudgetAnalysis'
-            )
-            session = boto3.Session(
-                aws_access_key_id=assumed_role['Credentials']['AccessKeyId'],
-                aws_secret_access_key=assumed_role['Credentials']['SecretAccessKey'],
-                aws_session_token=assumed_role['Credentials']['SessionToken'],
-                region_name='us-east-1'
+            credentials = get_role_credentials(body['roleArn'])
+            cache_owner = body['roleArn'].split(':')[4]  # Account ID of the analyzed account
+            ce = get_ce_client(
+                credentials['AccessKeyId'],
+                credentials['SecretAccessKey'],
+                credentials['SessionToken'],
+                'us-east-1'
             )
         else:
             # Validate required credentials are present
             if 'accessKeyId' not in body or 'secretAccessKey' not in body:
                 return {
                     'statusCode': 400,
-                    'headers': {
-                        'Content-Type': 'application/json',
-                        'Access-Control-Allow-Origin': allowed_origin
-                    },
-                    'body': json.dumps({'error': 'Missing required credentials. Provide either roleArn or both accessKeyId and secretAccessKey.'})
+                    'headers': JSON_HEADERS,
+                    'body': orjson.dumps({'error': 'Missing required credentials. Provide either roleArn or both accessKeyId and secretAccessKey.'}).decode()
                 }
-            session = boto3.Session(
-                aws_access_key_id=body['accessKeyId'],
-                aws_secret_access_key=body['secretAccessKey'],
-                region_name=body.get('region', 'us-east-1')
+            cache_owner = credential_digest(body['accessKeyId'], body['secretAccessKey'])
+            ce = get_ce_client(
+                body['accessKeyId'],
+                body['secretAccessKey'],
+                None,
+                body.get('region', 'us-east-1')
             )
     except Exception as e:
         print(f'Authentication error: {str(e)}')
         return {
             'statusCode': 401,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': allowed_origin
-            },
-            'body': json.dumps({'error': 'Authentication failed. Please check your credentials or role ARN.'})
+            'headers': JSON_HEADERS,
+            'body': orjson.dumps({'error': 'Authentication failed. Please check your credentials or role ARN.'}).decode()
         }
     
-    ce = session.client('ce')
-    
     # Analyze the last ANALYSIS_DAYS days leading up to and including breach date
     # (breach_dt was already parsed and validated earlier)
     analysis_start = (breach_dt - timedelta(days=ANALYSIS_DAYS - 1)).strftime('%Y-%m-%d')
     analysis_end = (breach_dt + timedelta(days=1)).strftime('%Y-%m-%d')  # End is exclusive
     
-    # Fetch DAILY cost data for trend analysis
-    daily_costs = []
-    daily_service_costs = {}
-    daily_regional_costs = {}
-    
-    try:
-        # Get total daily costs
-        daily_response = ce.get_cost_and_usage(
+    # Get detailed service breakdown for breach date
+    breach_day_start = breach_date
+    breach_day_end = analysis_end
+    
+    tax_filter = {'Not': {'Dimensions': {'Key': 'RECORD_TYPE', 'Values': ['Tax']}}}
+    
+    # Current-month Cost Explorer data is estimated and gets restated (credits,
+    # refunds, RI/SP amortization), so only windows that end before this month
+    # are served from the S3 cache when a report is regenerated
+    report_bucket = os.environ.get('REPORT_BUCKET')
+    current_month_start = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    s3 = None
+    if report_bucket and breach_dt + timedelta(days=1) <= current_month_start:
+        s3 = get_default_client('s3')
+    cache_prefix = f'ce-cache/{cache_owner}/'
+    
+    # The Cost Explorer requests are independent of each other, so issue them
+    # concurrently; each one is a network round-trip that dominates runtime.
+    with ThreadPoolExecutor(max_workers=CE_MAX_WORKERS) as executor:
+        # Daily costs by service and region (service, region and daily totals
+        # are all summed from these groups)
+        daily_cost_future = executor.submit(
+            fetch_cached_cost_and_usage, ce, s3, report_bucket, cache_prefix,
             TimePeriod={'Start': analysis_start, 'End': analysis_end},
             Granularity='DAILY',
             Metrics=['NetUnblendedCost'],
-            Filter={'Not': {'Dimensions': {'Key': 'RECORD_TYPE', 'Values': ['Tax']}}}
+            GroupBy=[
+                {'Type': 'DIMENSION', 'Key': 'SERVICE'},
+                {'Type': 'DIMENSION', 'Key': 'REGION'}
+            ],
+            Filter=tax_filter
         )
-        
-        for result in daily_response['ResultsByTime']:
-            day = result['TimePeriod']['Start']
-            cost = float(result['Total']['NetUnblendedCost']['Amount'])
-            daily_costs.append({'date': day, 'cost': cost})
-        
-        # Get daily costs by service
-        daily_service_response = ce.get_cost_and_usage(
-            TimePeriod={'Start': analysis_start, 'End': analysis_end},
+        # Service and usage type breakdown for the breach date
+        breach_detail_future = executor.submit(
+            fetch_cached_cost_and_usage, ce, s3, report_bucket, cache_prefix,
+            TimePeriod={'Start': breach_day_start, 'End': breach_day_end},
             Granularity='DAILY',
-            Metrics=['NetUnblendedCost'],
-            GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}],
-            Filter={'Not': {'Dimensions': {'Key': 'RECORD_TYPE', 'Values': ['Tax']}}}
+            Metrics=['NetUnblendedCost', 'UsageQuantity'],
+            GroupBy=[
+                {'Type': 'DIMENSION', 'Key': 'SERVICE'},
+                {'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'}
+            ],
+            Filter=tax_filter
         )
+    
+    # Fetch DAILY cost data for trend analysis
+    daily_service_costs = defaultdict(list)
+    daily_regional_costs = defaultdict(list)
+    
+    # The service groups of a day add up to its total, so the totals are
+    # accumulated from them instead of issuing a separate ungrouped query.
+    # Every day in the window starts at zero, as the ungrouped query reports
+    # days without any spend too. Window dates are built once here and carried
+    # on each day so the charts and tables never have to re-parse them.
+    window_dates = [breach_dt - timedelta(days=offset) for offset in range(ANALYSIS_DAYS - 1, -1, -1)]
+    daily_totals = {dt.strftime('%Y-%m-%d'): 0.0 for dt in window_dates}
+    
+    try:
+        daily_cost_results = daily_cost_future.result()
         
-        for result in daily_service_response['ResultsByTime']:
-            day = result['TimePeriod']['Start']
-            for group in result['Groups']:
-                service = group['Keys'][0]
-                cost = float(group['Metrics']['NetUnblendedCost']['Amount'])
-                if cost > 0:
-                    if service not in daily_service_costs:
-                        daily_service_costs[service] = []
-                    daily_service_costs[service].append({'date': day, 'cost': cost})
-        
-        # Get daily costs by region
-        daily_regional_response = ce.get_cost_and_usage(
-            TimePeriod={'Start': analysis_start, 'End': analysis_end},
-            Granularity='DAILY',
-            Metrics=['NetUnblendedCost'],
-            GroupBy=[{'Type': 'DIMENSION', 'Key': 'REGION'}],
-            Filter={'Not': {'Dimensions': {'Key': 'RECORD_TYPE', 'Values': ['Tax']}}}
-        )
+        # A single query grouped by service and region replaces one query per
+        # dimension; its groups are folded into per-day service and region
+        # costs. Pagination can split a day across results, so the sums are
+        # keyed by day rather than built per result.
+        service_day_costs = defaultdict(float)
+        region_day_costs = defaultdict(float)
         
-        for result in daily_regional_response['ResultsByTime']:
+        for result in daily_cost_results:
             day = result['TimePeriod']['Start']
             for group in result['Groups']:
-                region = group['Keys'][0]
-                cost = float(group['Metrics']['NetUnblendedCost']['Amount'])
-                if cost > 0:
-                    if region not in daily_regional_costs:
-                        daily_regional_costs[region] = []
-                    daily_regional_costs[region].append({'date': day, 'cost': cost})
+                amount = group['Metrics']['NetUnblendedCost']['Amount']
+                if amount in ZERO_AMOUNTS:
+                    continue  # Most groups are unused; skip them before parsing
+                service, region = group['Keys']
+                cost = float(amount)
+                service_day_costs[service, day] += cost
+                region_day_costs[region, day] += cost
+        
+        # Days arrive in order, so each key's entries stay chronological
+        for (service, day), cost in service_day_costs.items():
+            daily_totals[day] += cost  # Credits and refunds count towards the total
+            if cost > 0:
+                daily_service_costs[service].append({'date': day, 'cost': cost})
+        
+        for (region, day), cost in region_day_costs.items():
+            if cost > 0:
+                daily_regional_costs[region].append({'date': day, 'cost': cost})
+        
+        daily_costs = [{'date': day, 'dt': dt, 'cost': cost}
+                       for (day, cost), dt in zip(daily_totals.items(), window_dates)]
                     
     except Exception as e:
         # Log the error for debugging but return generic message to client
         print(f'Error fetching cost data: {str(e)}')
         return {
             'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': allowed_origin
-            },
-            'body': json.dumps({'error': 'Failed to fetch cost data. Please check your credentials and ensure Cost Explorer is enabled.'})
+            'headers': JSON_HEADERS,
+            'body': orjson.dumps({'error': 'Failed to fetch cost data. Please check your credentials and ensure Cost Explorer is enabled.'}).decode()
         }
     
-    # Get detailed service breakdown for breach date
-    breach_day_start = breach_date
-    breach_day_end = (breach_dt + timedelta(days=1)).strftime('%Y-%m-%d')
-    
     breach_day_services = []
     try:
-        breach_detail_response = ce.get_cost_and_usage(
-            TimePeriod={'Start': breach_day_start, 'End': breach_day_end},
-            Granularity='DAILY',
-            Metrics=['NetUnblendedCost', 'UsageQuantity'],
-            GroupBy=[
-                {'Type': 'DIMENSION', 'Key': 'SERVICE'},
-                {'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'}
-            ],
-            Filter={'Not': {'Dimensions': {'Key': 'RECORD_TYPE', 'Values': ['Tax']}}}
-        )
+        breach_detail_results = breach_detail_future.result()
         
-        service_totals = {}
-        service_details = {}
+        service_totals = defaultdict(float)
+        service_details = defaultdict(list)
         
-        for result in breach_detail_response['ResultsByTime']:
+        for result in breach_detail_results:
             for group in result['Groups']:
-                service = group['Keys'][0]
-                usage_type = group['Keys'][1]
-                cost = float(group['Metrics']['NetUnblendedCost']['Amount'])
-                usage = float(group['Metrics']['UsageQuantity']['Amount'])
+                metrics = group['Metrics']
+                cost_amount = metrics['NetUnblendedCost']['Amount']
+                usage_amount = metrics['UsageQuantity']['Amount']
+                if cost_amount in ZERO_AMOUNTS and usage_amount in ZERO_AMOUNTS:
+                    continue  # Unused usage type; nothing to parse or keep
+                service, usage_type = group['Keys']
+                cost = float(cost_amount)
+                usage = float(usage_amount)
                 
                 if cost > 0 or (usage > 0 and is_compute_usage_type(usage_type)):
-                    if service not in service_totals:
-                        service_totals[service] = 0
-                        service_details[service] = []
                     service_totals[service] += cost
                     service_details[service].append({
                         'usage_type': usage_type,
@@ -251,12 +348,15 @@ def lambda_handler(event, context):
                         'usage': usage
                     })
         
-        # Build breach day services list
+        # Build breach day services list; details are ordered by cost once here
+        # so the analysis helpers can read the top usage type directly
         for service, total in service_totals.items():
+            details = service_details[service]
+            details.sort(key=lambda x: x['cost'], reverse=True)
             breach_day_services.append({
                 'service': service,
                 'cost': total,
-                'details': service_details.get(service, [])
+                'details': details
             })
         
         breach_day_services.sort(key=lambda x: x['cost'], reverse=True)
@@ -266,11 +366,8 @@ def lambda_handler(event, context):
         print(f'Warning: Could not fetch breach day service details: {str(e)}')
     
     # Calculate breach day cost
-    breach_day_cost = 0
-    for d in daily_costs:
-        if d['date'] == breach_date:
-            breach_day_cost = d['cost']
-            break
+    breach_idx = next((i for i, d in enumerate(daily_costs) if d['date'] == breach_date), None)
+    breach_day_cost = daily_costs[breach_idx]['cost'] if breach_idx is not None else 0
     
     # Calculate statistics
     if daily_costs:
@@ -284,10 +381,9 @@ def lambda_handler(event, context):
         
         # Calculate trend (is spending increasing?)
         if len(daily_costs) >= 3:
-            first_half = daily_costs[:len(daily_costs)//2]
-            second_half = daily_costs[len(daily_costs)//2:]
-            first_avg = sum(d['cost'] for d in first_half) / len(first_half)
-            second_avg = sum(d['cost'] for d in second_half) / len(second_half)
+            half = len(daily_costs) // 2
+            first_avg = sum(d['cost'] for d in daily_costs[:half]) / half
+            second_avg = sum(d['cost'] for d in daily_costs[half:]) / (len(daily_costs) - half)
             trend_direction = 'increasing' if second_avg > first_avg else 'decreasing' if second_avg < first_avg else 'stable'
             trend_change_pct = ((second_avg - first_avg) / first_avg * 100) if first_avg > 0 else 0
         else:
@@ -296,64 +392,265 @@ def lambda_handler(event, context):
     else:
         total_period_cost = 0
         avg_daily_cost = 0
-        max_day = {'date': breach_date, 'cost': 0}
-        min_day = {'date': breach_date, 'cost': 0}
+        max_day = {'date': breach_date, 'dt': breach_dt, 'cost': 0}
+        min_day = {'date': breach_date, 'dt': breach_dt, 'cost': 0}
         days_over_budget = []
         trend_direction = 'stable'
         trend_change_pct = 0
     
-    # Generate charts
-    charts = generate_charts(daily_costs, daily_service_costs, daily_budget, breach_date)
-    
-    # Generate Word Document
-    doc = create_daily_breach_document(
-        daily_costs=daily_costs,
-        daily_service_costs=daily_service_costs,
-        daily_regional_costs=daily_regional_costs,
-        breach_day_services=breach_day_services,
-        daily_budget=daily_budget,
-        breach_date=breach_date,
-        breach_day_cost=breach_day_cost,
-        avg_daily_cost=avg_daily_cost,
-        max_day=max_day,
-        min_day=min_day,
-        days_over_budget=days_over_budget,
-        trend_direction=trend_direction,
-        trend_change_pct=trend_change_pct,
-        total_period_cost=total_period_cost,
-        charts=charts
-    )
-    
-    # Save to bytes
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
+    if not days_over_budget:
+        # Every day in the analysis window stayed within budget, so there is no
+        # breach to analyze; skip the charts and analysis sections and send a
+        # one-page summary
+        doc = create_minimal_document(daily_budget, breach_dt, breach_day_cost, avg_daily_cost)
+    else:
+        # Rank services by their analysis-period total once; the service chart and
+        # the cost drivers section both use this ordering
+        sorted_services = rank_by_total(daily_service_costs)
+        
+        # Generate charts
+        charts = generate_charts(daily_costs, sorted_services, daily_budget, breach_dt)
+        
+        # Generate Word Document
+        doc = create_daily_breach_document(
+            daily_costs=daily_costs,
+            sorted_services=sorted_services,
+            daily_regional_costs=daily_regional_costs,
+            breach_day_services=breach_day_services,
+            daily_budget=daily_budget,
+            breach_dt=breach_dt,
+            breach_day_cost=breach_day_cost,
+            avg_daily_cost=avg_daily_cost,
+            max_day=max_day,
+            min_day=min_day,
+            days_over_budget=days_over_budget,
+            trend_direction=trend_direction,
+            trend_change_pct=trend_change_pct,
+            total_period_cost=total_period_cost,
+            charts=charts
+        )
     
     report_date = datetime.now().strftime('%Y%m%d')
     filename = f"ExamOnline-Daily-Budget-Breach-{report_date}.docx"
     
+    # Save to a spooled file so unusually large reports spill to /tmp rather
+    # than being held in memory alongside their base64 encoding
+    with SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_BYTES) as buffer:
+        doc.save(buffer)
+        report_size = buffer.tell()
+        buffer.seek(0)
+        
+        # Large reports would not fit through API Gateway once base64-encoded,
+        # so hand them off to S3 and return a short-lived download link instead
+        download_url = None
+        if report_bucket and report_size > INLINE_REPORT_MAX_BYTES:
+            try:
+                download_url = upload_report(buffer, report_bucket, filename)
+            except Exception as e:
+                # Log error but continue - fall back to returning the file inline
+                print(f'Warning: Could not upload report to S3: {str(e)}')
+                buffer.seek(0)
+        
+        if download_url is None:
+            encoded_file = encode_base64_stream(buffer)
+    
+    if download_url is not None:
+        return {
+            'statusCode': 200,
+            'headers': {'Content-Type': 'application/json', **CORS_HEADERS},
+            'body': orjson.dumps({
+                'url': download_url,
+                'filename': filename
+            }).decode()
+        }
+    
+    # Return the document itself as a binary response; API Gateway decodes the
+    # base64 body, so no JSON envelope has to be built around the file
     return {
         'statusCode': 200,
         'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': allowed_origin,
-            'Access-Control-Allow-Headers': 'Content-Type',
-            'Access-Control-Allow-Methods': 'POST, OPTIONS'
+            'Content-Type': DOCX_CONTENT_TYPE,
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            **CORS_HEADERS,
+            'Access-Control-Expose-Headers': 'Content-Disposition'
         },
-        'body': json.dumps({
-            'file': base64.b64encode(buffer.read()).decode('utf-8'),
-            'filename': filename
-        })
+        'body': encoded_file,
+        'isBase64Encoded': True
     }
 
 
-def generate_charts(daily_costs, daily_service_costs, daily_budget, breach_date):
+def upload_report(stream, bucket, filename):
+    """Upload a saved report to S3 and return a pre-signed download URL.
+    
+    Uses the Lambda's own credentials rather than the analyzed account's
+    session, since the report bucket belongs to this deployment.
+    """
+    s3 = get_default_client('s3')
+    key = f'reports/{uuid.uuid4().hex}/{filename}'
+    s3.upload_fileobj(stream, bucket, key, ExtraArgs={'ContentType': DOCX_CONTENT_TYPE})
+    return s3.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': bucket,
+            'Key': key,
+            'ResponseContentDisposition': f'attachment; filename="{filename}"'
+        },
+        ExpiresIn=REPORT_URL_EXPIRY_SECONDS
+    )
+
+
+def encode_base64_stream(stream):
+    """Base64-encode a file object chunk by chunk instead of reading it whole."""
+    parts = []
+    chunk = stream.read(BASE64_CHUNK_BYTES)
+    while chunk:
+        parts.append(base64.b64encode(chunk).decode('ascii'))
+        chunk = stream.read(BASE64_CHUNK_BYTES)
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def get_default_client(service_name):
+    """Return a client for the Lambda's own credentials, created once per container.
+    
+    Building a client loads botocore's service model and opens a new
+    connection pool, so warm invocations reuse the one created on the
+    first request instead.
+    """
+    return boto3.client(service_name)
+
+
+# Temporary credentials from AssumeRole, keyed by role ARN
+assumed_role_cache = {}
+
+
+def get_role_credentials(role_arn):
+    """Return temporary credentials for role_arn, reusing them while still valid.
+    
+    Credentials are re-assumed once they are within
+    ROLE_CREDENTIAL_REFRESH_SECONDS of expiring, so a report never starts
+    with credentials that could lapse mid-fetch.
+    """
+    credentials = assumed_role_cache.get(role_arn)
+    if credentials is not None:
+        remaining = credentials['Expiration'] - datetime.now(timezone.utc)
+        if remaining > timedelta(seconds=ROLE_CREDENTIAL_REFRESH_SECONDS):
+            return credentials
+    
+    sts = get_default_client('sts')
+    assumed_role = sts.assume_role(
+        RoleArn=role_arn,
+        RoleSessionName='ExamOnlineBudgetAnalysis'
+    )
+    credentials = assumed_role['Credentials']
+    assumed_role_cache[role_arn] = credentials
+    return credentials
+
+
+def credential_digest(*parts):
+    """Return a short one-way digest identifying a set of credentials."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+# Cost Explorer clients from previous warm invocations, most recently used last
+ce_client_cache = OrderedDict()
+
+
+def get_ce_client(access_key_id, secret_access_key, session_token, region):
+    """Return a Cost Explorer client for the given credentials, reusing warm ones.
+    
+    Clients are keyed by a digest of the credentials so raw secrets are never
+    held as dictionary keys, and the least recently used client is evicted
+    once CE_CLIENT_CACHE_SIZE is exceeded.
+    """
+    cache_key = (credential_digest(access_key_id, secret_access_key, session_token or ''), region)
+    
+    ce = ce_client_cache.get(cache_key)
+    if ce is not None:
+        ce_client_cache.move_to_end(cache_key)
+        return ce
+    
+    session = boto3.Session(
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        aws_session_token=session_token,
+        region_name=region
+    )
+    ce = session.client('ce')
+    ce_client_cache[cache_key] = ce
+    if len(ce_client_cache) > CE_CLIENT_CACHE_SIZE:
+        ce_client_cache.popitem(last=False)
+    return ce
+
+
+def fetch_cached_cost_and_usage(ce, s3, bucket, prefix, **kwargs):
+    """Run fetch_cost_and_usage, reusing results cached in S3 when s3 is given.
+    
+    Cache objects are keyed by a digest of the query, so any change to the
+    period, grouping or filter is a cache miss. Results are only cached when
+    Cost Explorer marks none of them as estimated. Cache failures are logged
+    and fall back to querying Cost Explorer.
+    """
+    if s3 is None:
+        return fetch_cost_and_usage(ce, **kwargs)
+    
+    query_digest = hashlib.blake2b(orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS), digest_size=16)
+    key = f'{prefix}{query_digest.hexdigest()}.json.gz'
+    try:
+        cached = s3.get_object(Bucket=bucket, Key=key)
+        return orjson.loads(gzip.decompress(cached['Body'].read()))
+    except s3.exceptions.NoSuchKey:
+        pass
+    except Exception as e:
+        print(f'Warning: Could not read cached cost data: {str(e)}')
+    
+    results = fetch_cost_and_usage(ce, **kwargs)
+    if any(result.get('Estimated', True) for result in results):
+        return results  # Still subject to restatement; don't cache
+    try:
+        s3.put_object(Bucket=bucket, Key=key, Body=gzip.compress(orjson.dumps(results)))
+    except Exception as e:
+        print(f'Warning: Could not cache cost data: {str(e)}')
+    return results
+
+
+def fetch_cost_and_usage(ce, **kwargs):
+    """Run a Cost Explorer query and return ResultsByTime from every page.
+    
+    Grouped queries (e.g. SERVICE x USAGE_TYPE) are split across pages on
+    larger accounts. Cost Explorer has no boto3 paginator for this operation,
+    so NextPageToken is followed manually.
+    """
+    results = []
+    while True:
+        response = ce.get_cost_and_usage(**kwargs)
+        results.extend(response['ResultsByTime'])
+        next_token = response.get('NextPageToken')
+        if not next_token:
+            return results
+        kwargs['NextPageToken'] = next_token
+
+
+def generate_charts(daily_costs, sorted_services, daily_budget, breach_dt):
     """Generate chart images for the report."""
     charts = {}
     
     if not daily_costs:
         return charts
     
+    # Import matplotlib here rather than at module load - it is by far the
+    # heaviest import and only needed once a report is actually being built,
+    # so cold starts that fail validation or authentication never pay for it
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend for Lambda
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    from matplotlib.ticker import MaxNLocator
+    
     # Set style for professional look (with fallback for different matplotlib versions)
     try:
         plt.style.use('seaborn-v0_8-whitegrid')
@@ -366,7 +663,7 @@ def generate_charts(daily_costs, daily_service_costs, daily_budget, breach_date)
     # Chart 1: Daily Cost Trend with Budget Line
     fig1, ax1 = plt.subplots(figsize=(10, 5))
     
-    dates = [datetime.strptime(d['date'], '%Y-%m-%d') for d in daily_costs]
+    dates = [d['dt'] for d in daily_costs]
     costs = [d['cost'] for d in daily_costs]
     
     # Create bar chart
@@ -377,9 +674,8 @@ def generate_charts(daily_costs, daily_service_costs, daily_budget, breach_date)
     ax1.axhline(y=daily_budget, color='#ff6600', linestyle='--', linewidth=2, label=f'Daily Budget (${daily_budget:.0f})')
     
     # Highlight breach date
-    breach_dt = datetime.strptime(breach_date, '%Y-%m-%d')
     for i, (date, bar) in enumerate(zip(dates, bars)):
-        if date.strftime('%Y-%m-%d') == breach_date:
+        if date == breach_dt:
             bar.set_edgecolor('#ff0000')
             bar.set_linewidth(3)
     
@@ -410,16 +706,10 @@ def generate_charts(daily_costs, daily_service_costs, daily_budget, breach_date)
     plt.close(fig1)
     
     # Chart 2: Service Cost Breakdown (Pie Chart)
-    if daily_service_costs:
+    if sorted_services:
         fig2, ax2 = plt.subplots(figsize=(8, 6))
         
-        # Calculate total cost per service
-        service_totals = {}
-        for service, costs_list in daily_service_costs.items():
-            service_totals[service] = sum(c['cost'] for c in costs_list)
-        
-        # Sort and take top 6
-        sorted_services = sorted(service_totals.items(), key=lambda x: x[1], reverse=True)
+        # Take top 6 (services are already sorted by total cost)
         top_services = sorted_services[:6]
         other_cost = sum(cost for _, cost in sorted_services[6:])
         
@@ -496,41 +786,51 @@ def generate_charts(daily_costs, daily_service_costs, daily_budget, breach_date)
     return charts
 
 
-def create_daily_breach_document(daily_costs, daily_service_costs, daily_regional_costs,
-                                  breach_day_services, daily_budget, breach_date,
-                                  breach_day_cost, avg_daily_cost, max_day, min_day,
-                                  days_over_budget, trend_direction, trend_change_pct,
-                                  total_period_cost, charts):
-    """Create a professionally formatted Word document for daily budget breach analysis."""
+def new_document():
+    """Return a new report document with margins and styles already set up."""
     # Use the CloudThat letterhead template if available, otherwise create a blank document
     if os.path.exists(TEMPLATE_PATH):
         doc = Document(TEMPLATE_PATH)
     else:
         doc = Document()
     
-    # ===== DOCUMENT SETUP =====
     setup_document(doc)
+    return doc
+
+
+def create_daily_breach_document(daily_costs, sorted_services, daily_regional_costs,
+                                  breach_day_services, daily_budget, breach_dt,
+                                  breach_day_cost, avg_daily_cost, max_day, min_day,
+                                  days_over_budget, trend_direction, trend_change_pct,
+                                  total_period_cost, charts):
+    """Create a professionally formatted Word document for daily budget breach analysis."""
+    # ===== DOCUMENT SETUP =====
+    doc = new_document()
+    
+    # Per-day cells shared by the trends table and the appendix
+    daily_rows = build_daily_rows(daily_costs, daily_budget)
     
     # ===== COVER PAGE =====
-    add_daily_cover_page(doc, daily_budget, breach_date, breach_day_cost)
+    add_daily_cover_page(doc, daily_budget, breach_dt, breach_day_cost)
     
     # ===== TABLE OF CONTENTS =====
     add_daily_table_of_contents(doc)
     
     # ===== EXECUTIVE SUMMARY =====
-    add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
+    add_daily_executive_summary(doc, daily_budget, breach_dt, breach_day_cost,
                                 avg_daily_cost, max_day, min_day, days_over_budget,
                                 trend_direction, trend_change_pct, total_period_cost,
                                 len(daily_costs), charts)
     
     # ===== DAILY COST TRENDS =====
-    add_daily_cost_trends_section(doc, daily_costs, daily_budget, breach_date, charts)
+    add_daily_cost_trends_section(doc, daily_costs, daily_rows, daily_budget, breach_dt,
+                                  total_period_cost, charts)
     
     # ===== BREACH DAY ANALYSIS =====
-    add_breach_day_analysis(doc, breach_day_services, breach_date, breach_day_cost, daily_budget)
+    add_breach_day_analysis(doc, breach_day_services, breach_dt, breach_day_cost, daily_budget)
     
     # ===== COST DRIVERS ANALYSIS =====
-    add_daily_cost_drivers(doc, daily_service_costs, daily_costs, daily_budget, charts)
+    add_daily_cost_drivers(doc, sorted_services, daily_costs, daily_budget, charts)
     
     # ===== REGIONAL ANALYSIS =====
     add_daily_regional_analysis(doc, daily_regional_costs)
@@ -539,13 +839,44 @@ def create_daily_breach_document(daily_costs, daily_service_costs, daily_regiona
     add_daily_recommendations(doc, breach_day_services, trend_direction, avg_daily_cost, daily_budget)
     
     # ===== APPENDIX =====
-    add_daily_appendix(doc, daily_costs, daily_budget)
+    add_daily_appendix(doc, daily_costs, daily_rows, daily_budget, total_period_cost,
+                       avg_daily_cost, max_day, min_day, days_over_budget)
     
     return doc
 
 
-def add_daily_cover_page(doc, daily_budget, breach_date, breach_day_cost):
-    """Add a professional cover page for daily breach report."""
+def create_minimal_document(daily_budget, breach_dt, breach_day_cost, avg_daily_cost):
+    """Create a one-page document for an analysis period that stayed within the daily budget."""
+    doc = new_document()
+    
+    add_cover_heading(doc, 'AWS Daily Budget Review')
+    
+    for _ in range(2):
+        doc.add_paragraph()
+    
+    headroom = daily_budget - breach_day_cost
+    headroom_pct = (headroom / daily_budget * 100) if daily_budget > 0 else 0
+    
+    add_info_box(doc, '✓ NO BUDGET BREACH',
+        f'On {breach_dt.strftime("%B %d, %Y")}, the daily AWS spending of ${breach_day_cost:,.2f} '
+        f'stayed within the daily budget of ${daily_budget:,.2f}, leaving ${headroom:,.2f} '
+        f'({headroom_pct:.1f}%) unused. Every day of the {ANALYSIS_DAYS}-day analysis period '
+        f'also stayed within budget, at an average daily cost of ${avg_daily_cost:,.2f}. '
+        f'No breach analysis is required for this period.',
+        RGBColor(232, 248, 240))
+    
+    doc.add_paragraph()
+    
+    gen_date = doc.add_paragraph()
+    gen_date.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = gen_date.add_run(f'Generated: {datetime.now().strftime("%B %d, %Y at %H:%M UTC")}')
+    set_font(run, name='Calibri', size=10, color=COLOR_SOFT_GRAY)
+    
+    return doc
+
+
+def add_cover_heading(doc, title_text):
+    """Add the company name, decorative line and report title that open a cover page."""
     # Add spacing at top
     for _ in range(4):
         doc.add_paragraph()
@@ -554,16 +885,13 @@ def add_daily_cover_page(doc, daily_budget, breach_date, breach_day_cost):
     company = doc.add_paragraph()
     company.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = company.add_run('ExamOnline')
-    run.font.name = 'Calibri Light'
-    run.font.size = Pt(42)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(0, 51, 102)
+    set_font(run, name='Calibri Light', size=42, bold=True, color=COLOR_NAVY)
     
     # Decorative line
     line = doc.add_paragraph()
     line.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = line.add_run('━' * 30)
-    run.font.color.rgb = RGBColor(0, 102, 153)
+    run = line.add_run(COVER_RULE)
+    run.font.color.rgb = COLOR_TEAL
     
     # Report title
     for _ in range(2):
@@ -571,47 +899,38 @@ def add_daily_cover_page(doc, daily_budget, breach_date, breach_day_cost):
     
     title = doc.add_paragraph()
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = title.add_run('AWS Daily Budget Breach')
-    run.font.name = 'Calibri Light'
-    run.font.size = Pt(32)
-    run.font.color.rgb = RGBColor(51, 51, 51)
+    run = title.add_run(title_text)
+    set_font(run, name='Calibri Light', size=32, color=COLOR_DARK_GRAY)
+
+
+def add_daily_cover_page(doc, daily_budget, breach_dt, breach_day_cost):
+    """Add a professional cover page for daily breach report."""
+    add_cover_heading(doc, 'AWS Daily Budget Breach')
     
     subtitle = doc.add_paragraph()
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = subtitle.add_run('Analysis Report')
-    run.font.name = 'Calibri Light'
-    run.font.size = Pt(28)
-    run.font.color.rgb = RGBColor(102, 102, 102)
+    set_font(run, name='Calibri Light', size=28, color=COLOR_MID_GRAY)
     
     # Details
     for _ in range(3):
         doc.add_paragraph()
     
-    # Format breach date nicely
-    breach_dt = datetime.strptime(breach_date, '%Y-%m-%d')
-    
     details = doc.add_paragraph()
     details.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = details.add_run(f'Breach Date: {breach_dt.strftime("%B %d, %Y")}')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(14)
-    run.font.color.rgb = RGBColor(51, 51, 51)
+    set_font(run, name='Calibri', size=14, color=COLOR_DARK_GRAY)
     
     budget_line = doc.add_paragraph()
     budget_line.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = budget_line.add_run(f'Daily Budget: ${daily_budget:,.2f}')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(14)
-    run.font.color.rgb = RGBColor(51, 51, 51)
+    set_font(run, name='Calibri', size=14, color=COLOR_DARK_GRAY)
     
     # Cost on breach day
     cost_line = doc.add_paragraph()
     cost_line.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = cost_line.add_run(f'Breach Day Cost: ${breach_day_cost:,.2f}')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(14)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(204, 0, 0)
+    set_font(run, name='Calibri', size=14, bold=True, color=COLOR_BRIGHT_RED)
     
     # Overage
     overage = breach_day_cost - daily_budget
@@ -620,9 +939,7 @@ def add_daily_cover_page(doc, daily_budget, breach_date, breach_day_cost):
     overage_line = doc.add_paragraph()
     overage_line.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = overage_line.add_run(f'Budget Exceeded by: ${overage:,.2f} ({overage_pct:.1f}%)')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(12)
-    run.font.color.rgb = RGBColor(204, 0, 0)
+    set_font(run, name='Calibri', size=12, color=COLOR_BRIGHT_RED)
     
     # Generation date
     for _ in range(4):
@@ -631,18 +948,13 @@ def add_daily_cover_page(doc, daily_budget, breach_date, breach_day_cost):
     gen_date = doc.add_paragraph()
     gen_date.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = gen_date.add_run(f'Generated: {datetime.now().strftime("%B %d, %Y at %H:%M UTC")}')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(10)
-    run.font.color.rgb = RGBColor(128, 128, 128)
+    set_font(run, name='Calibri', size=10, color=COLOR_SOFT_GRAY)
     
     # Confidential notice
     conf = doc.add_paragraph()
     conf.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = conf.add_run('CONFIDENTIAL - For Internal Use Only')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(9)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(153, 0, 0)
+    set_font(run, name='Calibri', size=9, bold=True, color=COLOR_DARK_RED)
     
     doc.add_page_break()
 
@@ -651,10 +963,7 @@ def add_daily_table_of_contents(doc):
     """Add a table of contents page for daily breach report."""
     toc_heading = doc.add_paragraph()
     run = toc_heading.add_run('Table of Contents')
-    run.font.name = 'Calibri Light'
-    run.font.size = Pt(24)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(0, 51, 102)
+    set_font(run, name='Calibri Light', size=24, bold=True, color=COLOR_NAVY)
     toc_heading.paragraph_format.space_after = Pt(24)
     
     # TOC entries
@@ -673,34 +982,27 @@ def add_daily_table_of_contents(doc):
         entry.paragraph_format.space_after = Pt(12)
         
         run = entry.add_run(f'{num}  ')
-        run.font.name = 'Calibri'
-        run.font.size = Pt(12)
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(0, 51, 102)
+        set_font(run, name='Calibri', size=12, bold=True, color=COLOR_NAVY)
         
         run = entry.add_run(title)
-        run.font.name = 'Calibri'
-        run.font.size = Pt(12)
+        set_font(run, name='Calibri', size=12)
         
-        run = entry.add_run('  ' + '.' * 60 + '  ')
-        run.font.color.rgb = RGBColor(180, 180, 180)
-        run.font.size = Pt(10)
+        run = entry.add_run(TOC_LEADER)
+        set_font(run, size=10, color=COLOR_LIGHT_GRAY)
         
         run = entry.add_run(page)
-        run.font.name = 'Calibri'
-        run.font.size = Pt(12)
+        set_font(run, name='Calibri', size=12)
     
     doc.add_page_break()
 
 
-def add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
+def add_daily_executive_summary(doc, daily_budget, breach_dt, breach_day_cost,
                                 avg_daily_cost, max_day, min_day, days_over_budget,
                                 trend_direction, trend_change_pct, total_period_cost,
                                 analysis_days, charts):
     """Add executive summary section for daily breach analysis."""
     doc.add_heading('Executive Summary', level=1)
     
-    breach_dt = datetime.strptime(breach_date, '%Y-%m-%d')
     overage = breach_day_cost - daily_budget
     overage_pct = (overage / daily_budget * 100) if daily_budget > 0 else 0
     
@@ -710,7 +1012,7 @@ def add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
         f'exceeded the daily budget threshold of ${daily_budget:,.2f} by ${overage:,.2f} '
         f'({overage_pct:.1f}%). This report analyzes the {analysis_days}-day period leading up to '
         f'the breach to identify cost drivers, trends, and provide actionable recommendations.',
-        RGBColor(232, 245, 253))
+        COLOR_INFO_BG)
     
     doc.add_paragraph()
     
@@ -721,14 +1023,9 @@ def add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
               f'Days Over Budget (Last {analysis_days}d)']
     
     metrics_table = doc.add_table(rows=2, cols=len(labels))
-    metrics_table.alignment = WD_TABLE_ALIGNMENT.CENTER
     format_metrics_table(metrics_table)
     
-    for i, label in enumerate(labels):
-        cell = metrics_table.rows[0].cells[i]
-        cell.text = label
-        format_cell(cell, bold=True, bg_color='003366', font_color='FFFFFF', 
-                   font_size=9, align='center')
+    format_header_row(metrics_table.rows[0], labels, '003366', font_size=9)
     
     values = [
         f'${daily_budget:,.2f}',
@@ -737,16 +1034,16 @@ def add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
         f'${avg_daily_cost:,.2f}',
         str(len(days_over_budget))
     ]
+    metrics_cells = metrics_table.rows[1].cells
     for i, value in enumerate(values):
-        cell = metrics_table.rows[1].cells[i]
-        cell.text = value
+        cell = metrics_cells[i]
         if i == 2:  # Overage column
             bg = 'FF6666'
         elif i == 4 and len(days_over_budget) > 0:  # Days over budget
             bg = 'FFCCCC'
         else:
             bg = 'F5F5F5'
-        format_cell(cell, bold=True, bg_color=bg, font_size=11, align='center')
+        fill_cell(cell, value, bold=True, bg_color=bg, font_size=11, align='center')
     
     doc.add_paragraph()
     
@@ -755,7 +1052,7 @@ def add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
         f'The daily budget of ${daily_budget:,.2f} was exceeded on {breach_dt.strftime("%B %d, %Y")}. '
         f'Spending reached ${breach_day_cost:,.2f}, which is {overage_pct:.1f}% over the limit. '
         f'Over the past {analysis_days} days, {len(days_over_budget)} day(s) exceeded the daily budget.',
-        RGBColor(255, 235, 235), RGBColor(153, 0, 0))
+        COLOR_ALERT_BG, COLOR_DARK_RED)
     
     doc.add_paragraph()
     
@@ -777,8 +1074,7 @@ def add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
     
     trend_para = doc.add_paragraph()
     run = trend_para.add_run(f'{trend_icon} Spending Trend: {trend_desc} ')
-    run.font.bold = True
-    run.font.size = Pt(12)
+    set_font(run, size=12, bold=True)
     
     if trend_change_pct != 0:
         change_text = f'({trend_change_pct:+.1f}% from first to second half of analysis period)'
@@ -786,8 +1082,8 @@ def add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
         run.font.size = Pt(11)
     
     # Peak spending info
-    max_dt = datetime.strptime(max_day['date'], '%Y-%m-%d')
-    min_dt = datetime.strptime(min_day['date'], '%Y-%m-%d')
+    max_dt = max_day['dt']
+    min_dt = min_day['dt']
     
     peak_para = doc.add_paragraph()
     peak_para.add_run('Highest Spend: ').bold = True
@@ -816,7 +1112,8 @@ def add_daily_executive_summary(doc, daily_budget, breach_date, breach_day_cost,
     doc.add_page_break()
 
 
-def add_daily_cost_trends_section(doc, daily_costs, daily_budget, breach_date, charts):
+def add_daily_cost_trends_section(doc, daily_costs, daily_rows, daily_budget, breach_dt,
+                                  total_period_cost, charts):
     """Add daily cost trends section with charts."""
     doc.add_heading('Daily Cost Trends', level=1)
     
@@ -837,20 +1134,19 @@ def add_daily_cost_trends_section(doc, daily_costs, daily_budget, breach_date, c
         run.add_picture(charts['cumulative_trend'], width=Inches(6.5))
         
         # Add explanation
-        total_spent = sum(d['cost'] for d in daily_costs)
         total_budget = daily_budget * len(daily_costs)
-        variance = total_spent - total_budget
+        variance = total_period_cost - total_budget
         
         explanation = doc.add_paragraph()
         if variance > 0:
             explanation.add_run(
-                f'Over the {len(daily_costs)}-day analysis period, total spending was ${total_spent:,.2f} '
+                f'Over the {len(daily_costs)}-day analysis period, total spending was ${total_period_cost:,.2f} '
                 f'compared to the cumulative budget of ${total_budget:,.2f}. '
                 f'This represents an overspend of ${variance:,.2f}.'
             )
         else:
             explanation.add_run(
-                f'Over the {len(daily_costs)}-day analysis period, total spending was ${total_spent:,.2f} '
+                f'Over the {len(daily_costs)}-day analysis period, total spending was ${total_period_cost:,.2f} '
                 f'compared to the cumulative budget of ${total_budget:,.2f}. '
                 f'Overall spending was ${abs(variance):,.2f} under the cumulative budget.'
             )
@@ -862,54 +1158,40 @@ def add_daily_cost_trends_section(doc, daily_costs, daily_budget, breach_date, c
     
     display_days = daily_costs[:MAX_DAILY_DISPLAY_DAYS] if len(daily_costs) > MAX_DAILY_DISPLAY_DAYS else daily_costs
     
-    daily_table = doc.add_table(rows=len(display_days) + 1, cols=5)
-    daily_table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    daily_table = doc.add_table(rows=1, cols=5)
     format_data_table(daily_table)
     
     headers = ['Date', 'Daily Cost', 'vs Budget', 'Status', 'Cumulative']
-    for i, header in enumerate(headers):
-        cell = daily_table.rows[0].cells[i]
-        cell.text = header
-        format_cell(cell, bold=True, bg_color='003366', font_color='FFFFFF',
-                   font_size=9, align='center')
+    format_header_row(daily_table.rows[0], headers, '003366', font_size=9)
     
     cumulative = 0
-    for row_idx, day_data in enumerate(display_days, 1):
-        row = daily_table.rows[row_idx]
+    table_rows = []
+    for day_data, day_row in zip(display_days, daily_rows):
         cumulative += day_data['cost']
         
-        date_obj = datetime.strptime(day_data['date'], '%Y-%m-%d')
-        row.cells[0].text = date_obj.strftime('%b %d')
-        format_cell(row.cells[0], font_size=9, align='center')
-        
-        row.cells[1].text = f"${day_data['cost']:,.2f}"
-        format_cell(row.cells[1], font_size=9, align='right')
-        
-        diff = day_data['cost'] - daily_budget
-        row.cells[2].text = f"{'+' if diff >= 0 else ''}${diff:,.2f}"
-        bg_diff = 'FFE6E6' if diff > 0 else 'E6FFE6' if diff < 0 else 'F5F5F5'
-        format_cell(row.cells[2], font_size=9, align='right', bg_color=bg_diff)
-        
-        if day_data['cost'] > daily_budget:
-            row.cells[3].text = '⚠️ OVER'
-            bg_status = 'FF6666'
+        if day_row['over']:
+            status = {'text': '⚠️ OVER', 'bg_color': 'FF6666', 'bold': True}
         else:
-            row.cells[3].text = '✓ OK'
-            bg_status = 'E6FFE6'
-        format_cell(row.cells[3], font_size=9, align='center', bg_color=bg_status, bold=True)
+            status = {'text': '✓ OK', 'bg_color': 'E6FFE6', 'bold': True}
         
-        row.cells[4].text = f"${cumulative:,.2f}"
-        format_cell(row.cells[4], font_size=9, align='right')
+        table_rows.append((
+            day_row['date'].strftime('%b %d'),
+            day_row['cost_text'],
+            {'text': day_row['diff_text'], 'bg_color': day_row['diff_bg']},
+            status,
+            f"${cumulative:,.2f}"
+        ))
+    
+    append_table_rows(daily_table, table_rows, ('center', 'right', 'right', 'center', 'right'),
+                      font_size=9)
     
     doc.add_page_break()
 
 
-def add_breach_day_analysis(doc, breach_day_services, breach_date, breach_day_cost, daily_budget):
+def add_breach_day_analysis(doc, breach_day_services, breach_dt, breach_day_cost, daily_budget):
     """Add detailed analysis of the breach day."""
     doc.add_heading('Breach Day Analysis', level=1)
     
-    breach_dt = datetime.strptime(breach_date, '%Y-%m-%d')
-    
     intro = doc.add_paragraph()
     intro.add_run(
         f'This section provides a detailed breakdown of costs on {breach_dt.strftime("%B %d, %Y")}, '
@@ -925,7 +1207,7 @@ def add_breach_day_analysis(doc, breach_day_services, breach_date, breach_day_co
         f'Total spending: ${breach_day_cost:,.2f}\n'
         f'Daily budget: ${daily_budget:,.2f}\n'
         f'Overage: ${overage:,.2f} ({overage_pct:.1f}% over budget)',
-        RGBColor(255, 240, 230), RGBColor(153, 76, 0))
+        COLOR_WARNING_BG, COLOR_BURNT_ORANGE)
     
     doc.add_paragraph()
     
@@ -934,28 +1216,21 @@ def add_breach_day_analysis(doc, breach_day_services, breach_date, breach_day_co
     
     if breach_day_services:
         svc_table = doc.add_table(rows=min(len(breach_day_services), 10) + 1, cols=4)
-        svc_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         format_data_table(svc_table)
         
         headers = ['Service', 'Cost', '% of Day Total', 'Contribution']
-        for i, header in enumerate(headers):
-            cell = svc_table.rows[0].cells[i]
-            cell.text = header
-            format_cell(cell, bold=True, bg_color='993300', font_color='FFFFFF',
-                       font_size=9, align='center')
+        format_header_row(svc_table.rows[0], headers, '993300', font_size=9)
         
+        row_cells = table_row_cells(svc_table)
         for row_idx, svc in enumerate(breach_day_services[:10], 1):
-            row = svc_table.rows[row_idx]
+            cells = row_cells[row_idx]
             
-            row.cells[0].text = truncate_service_name(svc['service'])
-            format_cell(row.cells[0], font_size=9, align='left')
+            fill_cell(cells[0], truncate_service_name(svc['service']), font_size=9, align='left')
             
-            row.cells[1].text = f"${svc['cost']:,.2f}"
-            format_cell(row.cells[1], font_size=9, align='right')
+            fill_cell(cells[1], f"${svc['cost']:,.2f}", font_size=9, align='right')
             
             pct = (svc['cost'] / breach_day_cost * 100) if breach_day_cost > 0 else 0
-            row.cells[2].text = f"{pct:.1f}%"
-            format_cell(row.cells[2], font_size=9, align='center')
+            fill_cell(cells[2], f"{pct:.1f}%", font_size=9, align='center')
             
             # Contribution indicator
             if pct > 30:
@@ -970,8 +1245,7 @@ def add_breach_day_analysis(doc, breach_day_services, breach_date, breach_day_co
             else:
                 contrib = 'LOW'
                 bg = 'E6FFE6'
-            row.cells[3].text = contrib
-            format_cell(row.cells[3], font_size=9, align='center', bg_color=bg, bold=True)
+            fill_cell(cells[3], contrib, font_size=9, align='center', bg_color=bg, bold=True)
         
         doc.add_paragraph()
         
@@ -984,8 +1258,7 @@ def add_breach_day_analysis(doc, breach_day_services, breach_date, breach_day_co
             svc_heading = doc.add_paragraph()
             svc_heading.add_run(f"📌 {truncate_service_name(svc['service'])} - ${svc['cost']:,.2f} ({pct:.1f}%)")
             svc_heading.runs[0].bold = True
-            svc_heading.runs[0].font.size = Pt(11)
-            svc_heading.runs[0].font.color.rgb = RGBColor(0, 51, 102)
+            set_font(svc_heading.runs[0], size=11, color=COLOR_NAVY)
             
             # Analyze service details
             if svc.get('details'):
@@ -993,14 +1266,14 @@ def add_breach_day_analysis(doc, breach_day_services, breach_date, breach_day_co
                 reason_para = doc.add_paragraph()
                 reason_para.add_run('Likely Cause: ').bold = True
                 reason_para.add_run(reason)
-                reason_para.paragraph_format.left_indent = Inches(0.25)
+                reason_para.paragraph_format.left_indent = INDENT_ITEM
             
             doc.add_paragraph()
     
     doc.add_page_break()
 
 
-def add_daily_cost_drivers(doc, daily_service_costs, daily_costs, daily_budget, charts):
+def add_daily_cost_drivers(doc, sorted_services, daily_costs, daily_budget, charts):
     """Add cost drivers analysis for daily budget breach."""
     doc.add_heading('Cost Drivers Analysis', level=1)
     
@@ -1021,42 +1294,29 @@ def add_daily_cost_drivers(doc, daily_service_costs, daily_costs, daily_budget,
         doc.add_paragraph()
     
     # Service totals over analysis period
-    if daily_service_costs:
+    if sorted_services:
         doc.add_heading('Service Cost Summary', level=2)
         
-        # Calculate totals
-        service_totals = {}
-        for service, costs_list in daily_service_costs.items():
-            service_totals[service] = sum(c['cost'] for c in costs_list)
-        
-        sorted_services = sorted(service_totals.items(), key=lambda x: x[1], reverse=True)
         total_cost = sum(cost for _, cost in sorted_services)
         
         # Table
         display_services = sorted_services[:10]
         svc_table = doc.add_table(rows=len(display_services) + 1, cols=4)
-        svc_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         format_data_table(svc_table)
         
         headers = ['Service', 'Total Cost', '% of Total', 'Impact']
-        for i, header in enumerate(headers):
-            cell = svc_table.rows[0].cells[i]
-            cell.text = header
-            format_cell(cell, bold=True, bg_color='003366', font_color='FFFFFF',
-                       font_size=9, align='center')
+        format_header_row(svc_table.rows[0], headers, '003366', font_size=9)
         
+        row_cells = table_row_cells(svc_table)
         for row_idx, (service, cost) in enumerate(display_services, 1):
-            row = svc_table.rows[row_idx]
+            cells = row_cells[row_idx]
             
-            row.cells[0].text = truncate_service_name(service)
-            format_cell(row.cells[0], font_size=9, align='left')
+            fill_cell(cells[0], truncate_service_name(service), font_size=9, align='left')
             
-            row.cells[1].text = f"${cost:,.2f}"
-            format_cell(row.cells[1], font_size=9, align='right')
+            fill_cell(cells[1], f"${cost:,.2f}", font_size=9, align='right')
             
             pct = (cost / total_cost * 100) if total_cost > 0 else 0
-            row.cells[2].text = f"{pct:.1f}%"
-            format_cell(row.cells[2], font_size=9, align='center')
+            fill_cell(cells[2], f"{pct:.1f}%", font_size=9, align='center')
             
             if pct > 30:
                 impact = 'CRITICAL'
@@ -1070,8 +1330,7 @@ def add_daily_cost_drivers(doc, daily_service_costs, daily_costs, daily_budget,
             else:
                 impact = 'LOW'
                 bg = 'E6FFE6'
-            row.cells[3].text = impact
-            format_cell(row.cells[3], font_size=9, align='center', bg_color=bg, bold=True)
+            fill_cell(cells[3], impact, font_size=9, align='center', bg_color=bg, bold=True)
     
     doc.add_page_break()
 
@@ -1088,11 +1347,7 @@ def add_daily_regional_analysis(doc, daily_regional_costs):
     
     if daily_regional_costs:
         # Calculate regional totals
-        region_totals = {}
-        for region, costs_list in daily_regional_costs.items():
-            region_totals[region] = sum(c['cost'] for c in costs_list)
-        
-        sorted_regions = sorted(region_totals.items(), key=lambda x: x[1], reverse=True)
+        sorted_regions = rank_by_total(daily_regional_costs)
         total_cost = sum(cost for _, cost in sorted_regions)
         
         # Filter regions with meaningful cost
@@ -1100,30 +1355,23 @@ def add_daily_regional_analysis(doc, daily_regional_costs):
         
         if meaningful_regions:
             reg_table = doc.add_table(rows=len(meaningful_regions) + 1, cols=3)
-            reg_table.alignment = WD_TABLE_ALIGNMENT.CENTER
             format_data_table(reg_table)
             
             headers = ['Region', 'Total Cost', '% of Total']
-            for i, header in enumerate(headers):
-                cell = reg_table.rows[0].cells[i]
-                cell.text = header
-                format_cell(cell, bold=True, bg_color='003366', font_color='FFFFFF',
-                           font_size=10, align='center')
+            format_header_row(reg_table.rows[0], headers, '003366', font_size=10)
             
+            row_cells = table_row_cells(reg_table)
             for row_idx, (region, cost) in enumerate(meaningful_regions, 1):
-                row = reg_table.rows[row_idx]
+                cells = row_cells[row_idx]
                 
                 # Format region name
                 region_display = region if region else 'Global'
-                row.cells[0].text = region_display
-                format_cell(row.cells[0], font_size=10, align='left')
+                fill_cell(cells[0], region_display, font_size=10, align='left')
                 
-                row.cells[1].text = f"${cost:,.2f}"
-                format_cell(row.cells[1], font_size=10, align='right')
+                fill_cell(cells[1], f"${cost:,.2f}", font_size=10, align='right')
                 
                 pct = (cost / total_cost * 100) if total_cost > 0 else 0
-                row.cells[2].text = f"{pct:.1f}%"
-                format_cell(row.cells[2], font_size=10, align='center')
+                fill_cell(cells[2], f"{pct:.1f}%", font_size=10, align='center')
     else:
         no_data = doc.add_paragraph()
         no_data.add_run('Regional cost data not available.')
@@ -1162,11 +1410,7 @@ def add_daily_recommendations(doc, breach_day_services, trend_direction, avg_dai
         'Set up CloudWatch alarms to alert when daily spend reaches 80% of the $100 budget.'
     )
     
-    for action in immediate_actions:
-        para = doc.add_paragraph()
-        para.add_run('• ')
-        para.add_run(action)
-        para.paragraph_format.left_indent = Inches(0.25)
+    add_bullet_paragraphs(doc, [('', action) for action in immediate_actions], indent=INDENT_ITEM)
     
     doc.add_paragraph()
     
@@ -1181,11 +1425,7 @@ def add_daily_recommendations(doc, breach_day_services, trend_direction, avg_dai
         'Enable AWS Cost Anomaly Detection for automatic alerts.'
     ]
     
-    for rec in short_term:
-        para = doc.add_paragraph()
-        para.add_run('• ')
-        para.add_run(rec)
-        para.paragraph_format.left_indent = Inches(0.25)
+    add_bullet_paragraphs(doc, [('', rec) for rec in short_term], indent=INDENT_ITEM)
     
     doc.add_paragraph()
     
@@ -1201,11 +1441,7 @@ def add_daily_recommendations(doc, breach_day_services, trend_direction, avg_dai
         'Create cost allocation reports for different teams/projects.'
     ]
     
-    for rec in long_term:
-        para = doc.add_paragraph()
-        para.add_run('• ')
-        para.add_run(rec)
-        para.paragraph_format.left_indent = Inches(0.25)
+    add_bullet_paragraphs(doc, [('', rec) for rec in long_term], indent=INDENT_ITEM)
     
     doc.add_paragraph()
     
@@ -1216,7 +1452,7 @@ def add_daily_recommendations(doc, breach_day_services, trend_direction, avg_dai
         add_alert_box(doc, '⚠️ ATTENTION REQUIRED',
             f'Average daily spending (${avg_daily_cost:,.2f}) is {avg_vs_budget:.1f}% above the daily budget. '
             f'Consistent cost optimization efforts are needed to bring spending within budget.',
-            RGBColor(255, 240, 230), RGBColor(153, 76, 0))
+            COLOR_WARNING_BG, COLOR_BURNT_ORANGE)
     else:
         add_info_box(doc, '✓ POSITIVE TREND',
             f'Average daily spending (${avg_daily_cost:,.2f}) is within the daily budget. '
@@ -1226,7 +1462,8 @@ def add_daily_recommendations(doc, breach_day_services, trend_direction, avg_dai
     doc.add_page_break()
 
 
-def add_daily_appendix(doc, daily_costs, daily_budget):
+def add_daily_appendix(doc, daily_costs, daily_rows, daily_budget, total_period_cost,
+                       avg_daily_cost, max_day, min_day, days_over_budget):
     """Add appendix with complete daily data."""
     doc.add_heading('Appendix: Complete Daily Data', level=1)
     
@@ -1238,56 +1475,38 @@ def add_daily_appendix(doc, daily_costs, daily_budget):
     
     if daily_costs:
         # Full daily table
-        full_table = doc.add_table(rows=len(daily_costs) + 1, cols=4)
-        full_table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        full_table = doc.add_table(rows=1, cols=4)
         format_data_table(full_table)
         
         headers = ['Date', 'Daily Cost', 'vs Budget', 'Status']
-        for i, header in enumerate(headers):
-            cell = full_table.rows[0].cells[i]
-            cell.text = header
-            format_cell(cell, bold=True, bg_color='003366', font_color='FFFFFF',
-                       font_size=9, align='center')
-        
-        for row_idx, day_data in enumerate(daily_costs, 1):
-            row = full_table.rows[row_idx]
-            
-            date_obj = datetime.strptime(day_data['date'], '%Y-%m-%d')
-            row.cells[0].text = date_obj.strftime('%Y-%m-%d')
-            format_cell(row.cells[0], font_size=9, align='center')
-            
-            row.cells[1].text = f"${day_data['cost']:,.2f}"
-            format_cell(row.cells[1], font_size=9, align='right')
-            
-            diff = day_data['cost'] - daily_budget
-            row.cells[2].text = f"{'+' if diff >= 0 else ''}${diff:,.2f}"
-            bg_diff = 'FFE6E6' if diff > 0 else 'E6FFE6' if diff < 0 else 'F5F5F5'
-            format_cell(row.cells[2], font_size=9, align='right', bg_color=bg_diff)
-            
-            if day_data['cost'] > daily_budget:
-                row.cells[3].text = 'OVER BUDGET'
-                bg_status = 'FF6666'
-            else:
-                row.cells[3].text = 'OK'
-                bg_status = 'E6FFE6'
-            format_cell(row.cells[3], font_size=9, align='center', bg_color=bg_status, bold=True)
+        format_header_row(full_table.rows[0], headers, '003366', font_size=9)
+        
+        table_rows = [
+            (
+                day_data['date'],
+                day_row['cost_text'],
+                {'text': day_row['diff_text'], 'bg_color': day_row['diff_bg']},
+                {'text': 'OVER BUDGET', 'bg_color': 'FF6666', 'bold': True} if day_row['over']
+                else {'text': 'OK', 'bg_color': 'E6FFE6', 'bold': True}
+            )
+            for day_data, day_row in zip(daily_costs, daily_rows)
+        ]
+        append_table_rows(full_table, table_rows, ('center', 'right', 'right', 'center'),
+                          font_size=9)
         
         # Summary statistics
         doc.add_paragraph()
         doc.add_heading('Summary Statistics', level=2)
         
-        total = sum(d['cost'] for d in daily_costs)
-        avg = total / len(daily_costs) if daily_costs else 0
-        max_d = max(daily_costs, key=lambda x: x['cost'])
-        min_d = min(daily_costs, key=lambda x: x['cost'])
-        over_budget_days = sum(1 for d in daily_costs if d['cost'] > daily_budget)
+        # Reuse the statistics computed for the executive summary
+        over_budget_days = len(days_over_budget)
         
         stats = [
             f'Total Days Analyzed: {len(daily_costs)}',
-            f'Total Spending: ${total:,.2f}',
-            f'Average Daily Spending: ${avg:,.2f}',
-            f'Maximum Daily Spending: ${max_d["cost"]:,.2f} ({max_d["date"]})',
-            f'Minimum Daily Spending: ${min_d["cost"]:,.2f} ({min_d["date"]})',
+            f'Total Spending: ${total_period_cost:,.2f}',
+            f'Average Daily Spending: ${avg_daily_cost:,.2f}',
+            f'Maximum Daily Spending: ${max_day["cost"]:,.2f} ({max_day["date"]})',
+            f'Minimum Daily Spending: ${min_day["cost"]:,.2f} ({min_day["date"]})',
             f'Days Over Budget: {over_budget_days}',
             f'Days Under Budget: {len(daily_costs) - over_budget_days}'
         ]
@@ -1297,38 +1516,56 @@ def add_daily_appendix(doc, daily_costs, daily_budget):
             para.add_run('• ' + stat)
 
 
+def rank_by_total(daily_costs_by_key):
+    """Total each key's daily costs and return (key, total) pairs, highest first."""
+    totals = [(key, sum(c['cost'] for c in costs_list))
+              for key, costs_list in daily_costs_by_key.items()]
+    totals.sort(key=lambda x: x[1], reverse=True)
+    return totals
+
+
+def build_daily_rows(daily_costs, daily_budget):
+    """Precompute the per-day table values shared by several report tables."""
+    rows = []
+    for day_data in daily_costs:
+        diff = day_data['cost'] - daily_budget
+        rows.append({
+            'date': day_data['dt'],
+            'cost_text': f"${day_data['cost']:,.2f}",
+            'diff_text': f"{'+' if diff >= 0 else ''}${diff:,.2f}",
+            'diff_bg': 'FFE6E6' if diff > 0 else 'E6FFE6' if diff < 0 else 'F5F5F5',
+            'over': day_data['cost'] > daily_budget
+        })
+    return rows
+
+
 def analyze_daily_service_cost(svc):
     """Analyze service cost details to determine likely cause."""
-    details = svc.get('details', [])
+    details = svc['details']
     if not details:
         return 'Insufficient detail data to determine specific cause.'
     
-    # Sort by cost
-    sorted_details = sorted(details, key=lambda x: x['cost'], reverse=True)
-    top_usage = sorted_details[0] if sorted_details else None
-    
-    if not top_usage:
-        return 'Unable to determine specific usage pattern.'
-    
-    usage_type = top_usage['usage_type']
+    # Details are already sorted by cost (highest first) at ingestion
+    usage_type = details[0]['usage_type']
     
     # Analyze based on service name and usage type
     service_name = svc['service'].lower()
+    usage_lower = usage_type.lower()
     
     if 'ec2' in service_name:
-        if 'boxusage' in usage_type.lower():
+        if 'boxusage' in usage_lower:
             return f'High compute usage detected ({simplify_usage_type(usage_type)}). Review instance sizes and running hours.'
-        elif 'datatransfer' in usage_type.lower():
+        elif 'datatransfer' in usage_lower:
             return 'Data transfer costs are significant. Consider optimizing data movement patterns.'
-        elif 'ebs' in usage_type.lower():
+        elif 'ebs' in usage_lower:
             return 'EBS storage costs detected. Review volume sizes and snapshot policies.'
         else:
             return f'Review EC2 usage pattern: {simplify_usage_type(usage_type)}'
     
     elif 's3' in service_name:
-        if 'storage' in usage_type.lower():
+        if 'storage' in usage_lower:
             return 'S3 storage costs are high. Consider lifecycle policies and storage class optimization.'
-        elif 'request' in usage_type.lower():
+        elif 'request' in usage_lower:
             return 'High number of S3 requests. Review access patterns and consider caching.'
         else:
             return f'Review S3 usage: {simplify_usage_type(usage_type)}'
@@ -1367,38 +1604,27 @@ def setup_document(doc):
     
     # Normal style
     normal = styles['Normal']
-    normal.font.name = 'Calibri'
-    normal.font.size = Pt(11)
-    normal.font.color.rgb = RGBColor(0, 0, 0)
+    set_font(normal, name='Calibri', size=11, color=RGBColor(0, 0, 0))
     normal.paragraph_format.space_after = Pt(8)
     normal.paragraph_format.line_spacing_rule = WD_LINE_SPACING.SINGLE
     
     # Heading 1
     h1 = styles['Heading 1']
-    h1.font.name = 'Calibri Light'
-    h1.font.size = Pt(24)
-    h1.font.bold = True
-    h1.font.color.rgb = RGBColor(0, 51, 102)
+    set_font(h1, name='Calibri Light', size=24, bold=True, color=COLOR_NAVY)
     h1.paragraph_format.space_before = Pt(24)
     h1.paragraph_format.space_after = Pt(12)
     h1.paragraph_format.keep_with_next = True
     
     # Heading 2
     h2 = styles['Heading 2']
-    h2.font.name = 'Calibri Light'
-    h2.font.size = Pt(16)
-    h2.font.bold = True
-    h2.font.color.rgb = RGBColor(0, 82, 147)
+    set_font(h2, name='Calibri Light', size=16, bold=True, color=RGBColor(0, 82, 147))
     h2.paragraph_format.space_before = Pt(18)
     h2.paragraph_format.space_after = Pt(8)
     h2.paragraph_format.keep_with_next = True
     
     # Heading 3
     h3 = styles['Heading 3']
-    h3.font.name = 'Calibri'
-    h3.font.size = Pt(13)
-    h3.font.bold = True
-    h3.font.color.rgb = RGBColor(0, 102, 153)
+    set_font(h3, name='Calibri', size=13, bold=True, color=COLOR_TEAL)
     h3.paragraph_format.space_before = Pt(12)
     h3.paragraph_format.space_after = Pt(6)
     h3.paragraph_format.keep_with_next = True
@@ -1414,32 +1640,24 @@ def add_cover_page(doc, month_names, budget_amount, breach_date):
     company = doc.add_paragraph()
     company.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = company.add_run('ExamOnline')
-    run.font.name = 'Calibri Light'
-    run.font.size = Pt(42)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(0, 51, 102)
+    set_font(run, name='Calibri Light', size=42, bold=True, color=COLOR_NAVY)
     
     # Decorative line
     line = doc.add_paragraph()
     line.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = line.add_run('━' * 30)
-    run.font.color.rgb = RGBColor(0, 102, 153)
-    run.font.size = Pt(14)
+    run = line.add_run(COVER_RULE)
+    set_font(run, size=14, color=COLOR_TEAL)
     
     # Report title
     title = doc.add_paragraph()
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = title.add_run('AWS Budget Breach')
-    run.font.name = 'Calibri Light'
-    run.font.size = Pt(28)
-    run.font.color.rgb = RGBColor(68, 68, 68)
+    set_font(run, name='Calibri Light', size=28, color=COLOR_CHARCOAL)
     
     title2 = doc.add_paragraph()
     title2.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = title2.add_run('Analysis Report')
-    run.font.name = 'Calibri Light'
-    run.font.size = Pt(28)
-    run.font.color.rgb = RGBColor(68, 68, 68)
+    set_font(run, name='Calibri Light', size=28, color=COLOR_CHARCOAL)
     
     doc.add_paragraph()
     
@@ -1447,17 +1665,12 @@ def add_cover_page(doc, month_names, budget_amount, breach_date):
     period = doc.add_paragraph()
     period.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = period.add_run('Analysis Period')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(12)
-    run.font.color.rgb = RGBColor(102, 102, 102)
+    set_font(run, name='Calibri', size=12, color=COLOR_MID_GRAY)
     
     period_dates = doc.add_paragraph()
     period_dates.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = period_dates.add_run(f'{month_names[0]} — {month_names[-1]}')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(16)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(0, 51, 102)
+    set_font(run, name='Calibri', size=16, bold=True, color=COLOR_NAVY)
     
     doc.add_paragraph()
     
@@ -1466,17 +1679,12 @@ def add_cover_page(doc, month_names, budget_amount, breach_date):
         budget_label = doc.add_paragraph()
         budget_label.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = budget_label.add_run('Budget Threshold Exceeded')
-        run.font.name = 'Calibri'
-        run.font.size = Pt(12)
-        run.font.color.rgb = RGBColor(153, 0, 0)
+        set_font(run, name='Calibri', size=12, color=COLOR_DARK_RED)
         
         budget_value = doc.add_paragraph()
         budget_value.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = budget_value.add_run(f'${budget_amount:,.2f}')
-        run.font.name = 'Calibri'
-        run.font.size = Pt(20)
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(153, 0, 0)
+        set_font(run, name='Calibri', size=20, bold=True, color=COLOR_DARK_RED)
     
     # Add spacing before footer
     for _ in range(6):
@@ -1486,20 +1694,16 @@ def add_cover_page(doc, month_names, budget_amount, breach_date):
     date_para = doc.add_paragraph()
     date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = date_para.add_run(f'Report Generated: {datetime.now().strftime("%B %d, %Y")}')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(11)
+    set_font(run, name='Calibri', size=11)
     run.font.italic = True
-    run.font.color.rgb = RGBColor(102, 102, 102)
+    run.font.color.rgb = COLOR_MID_GRAY
     
     # Confidential notice
     conf = doc.add_paragraph()
     conf.alignment = WD_ALIGN_PARAGRAPH.CENTER
     conf.paragraph_format.space_before = Pt(24)
     run = conf.add_run('CONFIDENTIAL')
-    run.font.name = 'Calibri'
-    run.font.size = Pt(11)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(153, 0, 0)
+    set_font(run, name='Calibri', size=11, bold=True, color=COLOR_DARK_RED)
     
     doc.add_page_break()
 
@@ -1508,10 +1712,7 @@ def add_table_of_contents(doc):
     """Add a table of contents page."""
     toc_heading = doc.add_paragraph()
     run = toc_heading.add_run('Table of Contents')
-    run.font.name = 'Calibri Light'
-    run.font.size = Pt(24)
-    run.font.bold = True
-    run.font.color.rgb = RGBColor(0, 51, 102)
+    set_font(run, name='Calibri Light', size=24, bold=True, color=COLOR_NAVY)
     toc_heading.paragraph_format.space_after = Pt(24)
     
     # TOC entries
@@ -1531,24 +1732,18 @@ def add_table_of_contents(doc):
         
         # Number
         run = entry.add_run(f'{num}  ')
-        run.font.name = 'Calibri'
-        run.font.size = Pt(12)
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(0, 51, 102)
+        set_font(run, name='Calibri', size=12, bold=True, color=COLOR_NAVY)
         
         # Title
         run = entry.add_run(title)
-        run.font.name = 'Calibri'
-        run.font.size = Pt(12)
+        set_font(run, name='Calibri', size=12)
         
         # Dots and page number
-        run = entry.add_run('  ' + '.' * 60 + '  ')
-        run.font.color.rgb = RGBColor(180, 180, 180)
-        run.font.size = Pt(10)
+        run = entry.add_run(TOC_LEADER)
+        set_font(run, size=10, color=COLOR_LIGHT_GRAY)
         
         run = entry.add_run(page)
-        run.font.name = 'Calibri'
-        run.font.size = Pt(12)
+        set_font(run, name='Calibri', size=12)
     
     doc.add_page_break()
 
@@ -1565,7 +1760,7 @@ def add_executive_summary(doc, increased_services, month_names, budget_amount,
         f'{month_names[0]} (baseline) and {month_names[-1]} (breach period). The analysis '
         f'compares month-over-month spending changes from when the budget resets on the 1st, '
         f'identifies services with cost growth, and provides actionable recommendations.',
-        RGBColor(232, 245, 253))
+        COLOR_INFO_BG)
     
     doc.add_paragraph()
     
@@ -1577,14 +1772,9 @@ def add_executive_summary(doc, increased_services, month_names, budget_amount,
     
     # Create metrics table - columns based on labels count
     metrics_table = doc.add_table(rows=2, cols=len(labels))
-    metrics_table.alignment = WD_TABLE_ALIGNMENT.CENTER
     format_metrics_table(metrics_table)
     
-    for i, label in enumerate(labels):
-        cell = metrics_table.rows[0].cells[i]
-        cell.text = label
-        format_cell(cell, bold=True, bg_color='003366', font_color='FFFFFF', 
-                   font_size=9, align='center')
+    format_header_row(metrics_table.rows[0], labels, '003366', font_size=9)
     
     # Row 2 - Values
     overall_change = overall_current - overall_previous
@@ -1597,16 +1787,16 @@ def add_executive_summary(doc, increased_services, month_names, budget_amount,
         mtd_display,
         str(len(increased_services))
     ]
+    metrics_cells = metrics_table.rows[1].cells
     for i, value in enumerate(values):
-        cell = metrics_table.rows[1].cells[i]
-        cell.text = value
+        cell = metrics_cells[i]
         if i == 2 and overall_change > 0:
             bg = 'FFE6E6'
         elif i == 3 and budget_amount > 0 and mtd_total > budget_amount:
             bg = 'FFE6E6'
         else:
             bg = 'F5F5F5'
-        format_cell(cell, bold=True, bg_color=bg, font_size=12, align='center')
+        fill_cell(cell, value, bold=True, bg_color=bg, font_size=12, align='center')
     
     doc.add_paragraph()
     
@@ -1634,7 +1824,7 @@ def add_executive_summary(doc, increased_services, month_names, budget_amount,
                 f'threshold of ${budget_amount:,.2f} by ${overage:,.2f} ({overage_pct:.1f}%). '
                 f'Average daily spend: ${daily_avg:,.2f}. '
                 f'Immediate action is required to identify and address cost drivers.',
-                RGBColor(255, 235, 235), RGBColor(153, 0, 0))
+                COLOR_ALERT_BG, COLOR_DARK_RED)
         else:
             add_alert_box(doc, '✓ WITHIN BUDGET',
                 f'Current spending of ${overall_current:,.2f} is within the budget '
@@ -1649,36 +1839,28 @@ def add_executive_summary(doc, increased_services, month_names, budget_amount,
     
     if increased_services[:5]:
         summary_table = doc.add_table(rows=6, cols=5)
-        summary_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         format_data_table(summary_table)
         
         # Headers
         headers = ['Service', month_names[0], month_names[-1], 'Increase', '% Change']
-        for i, header in enumerate(headers):
-            cell = summary_table.rows[0].cells[i]
-            cell.text = header
-            format_cell(cell, bold=True, bg_color='0052CC', font_color='FFFFFF',
-                       font_size=10, align='center')
+        format_header_row(summary_table.rows[0], headers, '0052CC', font_size=10)
         
         # Data rows
+        row_cells = table_row_cells(summary_table)
         for row_idx, svc in enumerate(increased_services[:5], 1):
-            row = summary_table.rows[row_idx]
+            cells = row_cells[row_idx]
             
-            row.cells[0].text = truncate_service_name(svc['service'])
-            format_cell(row.cells[0], font_size=10, align='left')
+            fill_cell(cells[0], truncate_service_name(svc['service']), font_size=10, align='left')
             
-            row.cells[1].text = f"${svc['previous_cost']:,.2f}"
-            format_cell(row.cells[1], font_size=10, align='right')
+            fill_cell(cells[1], f"${svc['previous_cost']:,.2f}", font_size=10, align='right')
             
-            row.cells[2].text = f"${svc['current_cost']:,.2f}"
-            format_cell(row.cells[2], font_size=10, align='right')
+            fill_cell(cells[2], f"${svc['current_cost']:,.2f}", font_size=10, align='right')
             
-            row.cells[3].text = f"${svc['change']:,.2f}"
-            format_cell(row.cells[3], font_size=10, align='right', bg_color='FFEEEE')
+            fill_cell(cells[3], f"${svc['change']:,.2f}", font_size=10, align='right', bg_color='FFEEEE')
             
-            row.cells[4].text = f"{svc['pct_change']:.1f}%"
             bg = 'FF6666' if svc['pct_change'] > 50 else 'FFCCCC' if svc['pct_change'] > 20 else 'FFE6E6'
-            format_cell(row.cells[4], font_size=10, align='center', bg_color=bg, bold=True)
+            fill_cell(cells[4], f"{svc['pct_change']:.1f}%", font_size=10, align='center',
+                      bg_color=bg, bold=True)
     
     doc.add_page_break()
 
@@ -1709,15 +1891,10 @@ def add_daily_cost_trends(doc, daily_costs, daily_service_costs, budget_amount,
         doc.add_heading('MTD Spending Summary', level=2)
         
         summary_table = doc.add_table(rows=2, cols=4)
-        summary_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         format_metrics_table(summary_table)
         
         labels = ['Days Tracked', 'Total MTD Spend', 'Avg Daily Spend', 'Budget Used']
-        for i, label in enumerate(labels):
-            cell = summary_table.rows[0].cells[i]
-            cell.text = label
-            format_cell(cell, bold=True, bg_color='003366', font_color='FFFFFF',
-                       font_size=9, align='center')
+        format_header_row(summary_table.rows[0], labels, '003366', font_size=9)
         
         budget_used_pct = (total_mtd / budget_amount * 100) if budget_amount > 0 else 0
         values = [
@@ -1726,11 +1903,11 @@ def add_daily_cost_trends(doc, daily_costs, daily_service_costs, budget_amount,
             f'${avg_daily:,.2f}',
             f'{budget_used_pct:.1f}%' if budget_amount > 0 else 'N/A'
         ]
+        summary_cells = summary_table.rows[1].cells
         for i, value in enumerate(values):
-            cell = summary_table.rows[1].cells[i]
-            cell.text = value
+            cell = summary_cells[i]
             bg = 'FFE6E6' if i == 3 and budget_used_pct > 100 else 'F5F5F5'
-            format_cell(cell, bold=True, bg_color=bg, font_size=12, align='center')
+            fill_cell(cell, value, bold=True, bg_color=bg, font_size=12, align='center')
         
         doc.add_paragraph()
         
@@ -1741,40 +1918,33 @@ def add_daily_cost_trends(doc, daily_costs, daily_service_costs, budget_amount,
         display_days = daily_costs[:MAX_DAILY_DISPLAY_DAYS] if len(daily_costs) > MAX_DAILY_DISPLAY_DAYS else daily_costs
         
         daily_table = doc.add_table(rows=len(display_days) + 1, cols=4)
-        daily_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         format_data_table(daily_table)
         
         headers = ['Date', 'Daily Cost', 'Cumulative Total', 'vs Budget']
-        for i, header in enumerate(headers):
-            cell = daily_table.rows[0].cells[i]
-            cell.text = header
-            format_cell(cell, bold=True, bg_color='4A86C7', font_color='FFFFFF',
-                       font_size=9, align='center')
+        format_header_row(daily_table.rows[0], headers, '4A86C7', font_size=9)
         
         cumulative = 0
+        row_cells = table_row_cells(daily_table)
         for row_idx, day_data in enumerate(display_days, 1):
-            row = daily_table.rows[row_idx]
+            cells = row_cells[row_idx]
             cumulative += day_data['cost']
             
             # Format date nicely
             date_obj = datetime.strptime(day_data['date'], '%Y-%m-%d')
-            row.cells[0].text = date_obj.strftime('%b %d')
-            format_cell(row.cells[0], font_size=9, align='center')
+            fill_cell(cells[0], date_obj.strftime('%b %d'), font_size=9, align='center')
             
-            row.cells[1].text = f"${day_data['cost']:,.2f}"
-            format_cell(row.cells[1], font_size=9, align='right')
+            fill_cell(cells[1], f"${day_data['cost']:,.2f}", font_size=9, align='right')
             
-            row.cells[2].text = f"${cumulative:,.2f}"
-            format_cell(row.cells[2], font_size=9, align='right')
+            fill_cell(cells[2], f"${cumulative:,.2f}", font_size=9, align='right')
             
             if budget_amount > 0:
                 pct_of_budget = (cumulative / budget_amount * 100)
-                row.cells[3].text = f"{pct_of_budget:.1f}%"
+                budget_text = f"{pct_of_budget:.1f}%"
                 bg = 'FF6666' if pct_of_budget > 100 else 'FFCCCC' if pct_of_budget > 80 else 'F5F5F5'
             else:
-                row.cells[3].text = 'N/A'
+                budget_text = 'N/A'
                 bg = 'F5F5F5'
-            format_cell(row.cells[3], font_size=9, align='center', bg_color=bg)
+            fill_cell(cells[3], budget_text, font_size=9, align='center', bg_color=bg)
         
         doc.add_paragraph()
         
@@ -1814,28 +1984,21 @@ def add_daily_cost_trends(doc, daily_costs, daily_service_costs, budget_amount,
             
             if top_services:
                 svc_table = doc.add_table(rows=len(top_services) + 1, cols=3)
-                svc_table.alignment = WD_TABLE_ALIGNMENT.CENTER
                 format_data_table(svc_table)
                 
                 headers = ['Service', 'MTD Total', '% of MTD Spend']
-                for i, header in enumerate(headers):
-                    cell = svc_table.rows[0].cells[i]
-                    cell.text = header
-                    format_cell(cell, bold=True, bg_color='996600', font_color='FFFFFF',
-                               font_size=9, align='center')
+                format_header_row(svc_table.rows[0], headers, '996600', font_size=9)
                 
+                row_cells = table_row_cells(svc_table)
                 for row_idx, svc in enumerate(top_services, 1):
-                    row = svc_table.rows[row_idx]
+                    cells = row_cells[row_idx]
                     
-                    row.cells[0].text = truncate_service_name(svc['service'])
-                    format_cell(row.cells[0], font_size=9, align='left')
+                    fill_cell(cells[0], truncate_service_name(svc['service']), font_size=9, align='left')
                     
-                    row.cells[1].text = f"${svc['total']:,.2f}"
-                    format_cell(row.cells[1], font_size=9, align='right')
+                    fill_cell(cells[1], f"${svc['total']:,.2f}", font_size=9, align='right')
                     
                     pct = (svc['total'] / total_mtd * 100) if total_mtd > 0 else 0
-                    row.cells[2].text = f"{pct:.1f}%"
-                    format_cell(row.cells[2], font_size=9, align='center')
+                    fill_cell(cells[2], f"{pct:.1f}%", font_size=9, align='center')
     
     doc.add_page_break()
 
@@ -1860,18 +2023,14 @@ def add_cost_drivers_analysis(doc, increased_services, month_names, total_increa
         top_contributors = increased_services[:8]
         
         contrib_table = doc.add_table(rows=len(top_contributors) + 1, cols=4)
-        contrib_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         format_data_table(contrib_table)
         
         headers = ['Service', 'Cost Increase', '% of Total Increase', 'Impact Level']
-        for i, header in enumerate(headers):
-            cell = contrib_table.rows[0].cells[i]
-            cell.text = header
-            format_cell(cell, bold=True, bg_color='003366', font_color='FFFFFF',
-                       font_size=10, align='center')
+        format_header_row(contrib_table.rows[0], headers, '003366', font_size=10)
         
+        row_cells = table_row_cells(contrib_table)
         for row_idx, svc in enumerate(top_contributors, 1):
-            row = contrib_table.rows[row_idx]
+            cells = row_cells[row_idx]
             contribution = (svc['change'] / total_increase * 100) if total_increase > 0 else 0
             
             # Determine impact level
@@ -1888,18 +2047,13 @@ def add_cost_drivers_analysis(doc, increased_services, month_names, total_increa
                 impact = 'LOW'
                 impact_color = '00CC00'
             
-            row.cells[0].text = truncate_service_name(svc['service'])
-            format_cell(row.cells[0], font_size=10, align='left')
+            fill_cell(cells[0], truncate_service_name(svc['service']), font_size=10, align='left')
             
-            row.cells[1].text = f"${svc['change']:,.2f}"
-            format_cell(row.cells[1], font_size=10, align='right')
+            fill_cell(cells[1], f"${svc['change']:,.2f}", font_size=10, align='right')
             
-            row.cells[2].text = f"{contribution:.1f}%"
-            format_cell(row.cells[2], font_size=10, align='center')
+            fill_cell(cells[2], f"{contribution:.1f}%", font_size=10, align='center')
             
-            row.cells[3].text = impact
-            format_cell(row.cells[3], font_size=9, align='center', bold=True,
-                       font_color=impact_color)
+            fill_cell(cells[3], impact, font_size=9, align='center', bold=True, font_color=impact_color)
     
     doc.add_paragraph()
     
@@ -1913,9 +2067,7 @@ def add_cost_drivers_analysis(doc, increased_services, month_names, total_increa
         svc_para = doc.add_paragraph()
         svc_para.paragraph_format.space_before = Pt(16)
         run = svc_para.add_run(f'{i}. {svc["service"]}')
-        run.font.bold = True
-        run.font.size = Pt(13)
-        run.font.color.rgb = RGBColor(0, 51, 102)
+        set_font(run, size=13, bold=True, color=COLOR_NAVY)
         
         # Quick stats in a mini table
         stats_table = doc.add_table(rows=1, cols=4)
@@ -1927,33 +2079,30 @@ def add_cost_drivers_analysis(doc, increased_services, month_names, total_increa
             f"Increase: ${svc['change']:,.2f}",
             f"Growth: {svc['pct_change']:.1f}%"
         ]
+        stat_cells = stats_table.rows[0].cells
         for j, stat in enumerate(stats):
-            stats_table.rows[0].cells[j].text = stat
-            format_cell(stats_table.rows[0].cells[j], font_size=9, align='center',
-                       bg_color='F0F5FF')
+            fill_cell(stat_cells[j], stat, font_size=9, align='center', bg_color='F0F5FF')
         
         # Analysis
         driver_analysis = analyze_service_drivers(svc)
         
         analysis_para = doc.add_paragraph()
-        analysis_para.paragraph_format.left_indent = Inches(0.25)
+        analysis_para.paragraph_format.left_indent = INDENT_ITEM
         
         run = analysis_para.add_run('Root Cause: ')
-        run.font.bold = True
-        run.font.size = Pt(10)
+        set_font(run, size=10, bold=True)
         analysis_para.add_run(driver_analysis['primary_driver'])
         
         if driver_analysis['usage_changes']:
             changes_para = doc.add_paragraph()
-            changes_para.paragraph_format.left_indent = Inches(0.25)
+            changes_para.paragraph_format.left_indent = INDENT_ITEM
             run = changes_para.add_run('Key Observations:')
-            run.font.bold = True
-            run.font.size = Pt(10)
+            set_font(run, size=10, bold=True)
             
             for change in driver_analysis['usage_changes'][:3]:
                 bullet = doc.add_paragraph(f'• {change}')
-                bullet.paragraph_format.left_indent = Inches(0.5)
-                bullet.paragraph_format.space_after = Pt(2)
+                bullet.paragraph_format.left_indent = INDENT_SUB_ITEM
+                bullet.paragraph_format.space_after = SPACE_AFTER_SUB_ITEM
     
     doc.add_page_break()
 
@@ -1981,64 +2130,56 @@ def add_detailed_service_analysis(doc, increased_services, month_names, months):
         run.font.bold = True
         summary.add_run(f" ({month_names[-1]})  |  ")
         run = summary.add_run(f"Increase: ${svc['change']:,.2f} ({svc['pct_change']:.1f}%)")
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(153, 0, 0)
+        set_font(run, bold=True, color=COLOR_DARK_RED)
         
         # Usage breakdown
         data = svc['data']
         current_details = data.get(months[-1], {}).get('details', [])
         previous_details = data.get(months[0], {}).get('details', [])
-        prev_lookup = {d['usage_type']: d for d in previous_details}
+        previous_costs = {d['usage_type']: d['cost'] for d in previous_details}
         
-        # Find increased usage types
+        # Find increased usage types; only the five largest are reported
         changes = []
         for detail in current_details:
-            usage_type = detail['usage_type']
             current_cost = detail['cost']
-            previous_cost = prev_lookup.get(usage_type, {}).get('cost', 0)
+            previous_cost = previous_costs.get(detail['usage_type'], 0)
             change = current_cost - previous_cost
             if change > 0.01:
                 changes.append({
-                    'usage_type': usage_type,
+                    'usage_type': detail['usage_type'],
                     'previous': previous_cost,
                     'current': current_cost,
                     'change': change
                 })
         
-        changes.sort(key=lambda x: x['change'], reverse=True)
+        top_changes = heapq.nlargest(5, changes, key=lambda x: x['change'])
         
-        if changes[:5]:
+        if top_changes:
             doc.add_heading('Usage Type Breakdown', level=3)
             
-            usage_table = doc.add_table(rows=min(6, len(changes[:5]) + 1), cols=4)
+            usage_table = doc.add_table(rows=len(top_changes) + 1, cols=4)
             format_data_table(usage_table)
             
             headers = ['Usage Type', month_names[0], month_names[-1], 'Change']
-            for i, header in enumerate(headers):
-                cell = usage_table.rows[0].cells[i]
-                cell.text = header
-                format_cell(cell, bold=True, bg_color='4A86C7', font_color='FFFFFF',
-                           font_size=9, align='center')
+            format_header_row(usage_table.rows[0], headers, '4A86C7', font_size=9)
             
-            for row_idx, change in enumerate(changes[:5], 1):
-                row = usage_table.rows[row_idx]
-                row.cells[0].text = simplify_usage_type(change['usage_type'])
-                format_cell(row.cells[0], font_size=9, align='left')
+            row_cells = table_row_cells(usage_table)
+            for row_idx, change in enumerate(top_changes, 1):
+                cells = row_cells[row_idx]
+                fill_cell(cells[0], simplify_usage_type(change['usage_type']), font_size=9, align='left')
                 
-                row.cells[1].text = f"${change['previous']:,.2f}"
-                format_cell(row.cells[1], font_size=9, align='right')
+                fill_cell(cells[1], f"${change['previous']:,.2f}", font_size=9, align='right')
                 
-                row.cells[2].text = f"${change['current']:,.2f}"
-                format_cell(row.cells[2], font_size=9, align='right')
+                fill_cell(cells[2], f"${change['current']:,.2f}", font_size=9, align='right')
                 
-                row.cells[3].text = f"+${change['change']:,.2f}"
-                format_cell(row.cells[3], font_size=9, align='right', bg_color='FFEEEE')
+                fill_cell(cells[3], f"+${change['change']:,.2f}", font_size=9, align='right',
+                          bg_color='FFEEEE')
         
         # Reason analysis
         doc.add_heading('Analysis & Root Cause', level=3)
-        reason = generate_detailed_reason(svc, changes)
+        reason = generate_detailed_reason(svc, top_changes)
         reason_para = doc.add_paragraph(reason)
-        reason_para.paragraph_format.left_indent = Inches(0.25)
+        reason_para.paragraph_format.left_indent = INDENT_ITEM
         
         doc.add_paragraph()
 
@@ -2077,25 +2218,18 @@ def add_regional_analysis(doc, regional_costs, months, month_names):
         format_data_table(table)
         
         headers = ['Region', month_names[0], month_names[-1], 'Increase']
-        for i, header in enumerate(headers):
-            cell = table.rows[0].cells[i]
-            cell.text = header
-            format_cell(cell, bold=True, bg_color='996600', font_color='FFFFFF',
-                       font_size=10, align='center')
+        format_header_row(table.rows[0], headers, '996600', font_size=10)
         
+        row_cells = table_row_cells(table)
         for row_idx, rc in enumerate(region_changes, 1):
-            row = table.rows[row_idx]
-            row.cells[0].text = rc['region']
-            format_cell(row.cells[0], font_size=10, align='left')
+            cells = row_cells[row_idx]
+            fill_cell(cells[0], rc['region'], font_size=10, align='left')
             
-            row.cells[1].text = f"${rc['previous']:,.2f}"
-            format_cell(row.cells[1], font_size=10, align='right')
+            fill_cell(cells[1], f"${rc['previous']:,.2f}", font_size=10, align='right')
             
-            row.cells[2].text = f"${rc['current']:,.2f}"
-            format_cell(row.cells[2], font_size=10, align='right')
+            fill_cell(cells[2], f"${rc['current']:,.2f}", font_size=10, align='right')
             
-            row.cells[3].text = f"+${rc['change']:,.2f}"
-            format_cell(row.cells[3], font_size=10, align='right', bg_color='FFF5E6')
+            fill_cell(cells[3], f"+${rc['change']:,.2f}", font_size=10, align='right', bg_color='FFF5E6')
     else:
         doc.add_paragraph('No regions with significant cost increases were identified.')
     
@@ -2120,17 +2254,16 @@ def add_recommendations(doc, increased_services):
     for i, action in enumerate(immediate, 1):
         action_para = doc.add_paragraph()
         run = action_para.add_run(f'{i}. {action["title"]}')
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(153, 0, 0)
+        set_font(run, bold=True, color=COLOR_DARK_RED)
         
         desc_para = doc.add_paragraph(action['description'])
-        desc_para.paragraph_format.left_indent = Inches(0.25)
+        desc_para.paragraph_format.left_indent = INDENT_ITEM
         
         if action.get('steps'):
             for step in action['steps']:
                 step_para = doc.add_paragraph(f'• {step}')
-                step_para.paragraph_format.left_indent = Inches(0.5)
-                step_para.paragraph_format.space_after = Pt(2)
+                step_para.paragraph_format.left_indent = INDENT_SUB_ITEM
+                step_para.paragraph_format.space_after = SPACE_AFTER_SUB_ITEM
     
     doc.add_paragraph()
     
@@ -2148,11 +2281,7 @@ def add_recommendations(doc, increased_services):
          'Identify and terminate unused EC2 instances, EBS volumes, and other idle resources.'),
     ]
     
-    for title, desc in short_term:
-        para = doc.add_paragraph()
-        run = para.add_run(f'• {title}: ')
-        run.font.bold = True
-        para.add_run(desc)
+    add_bullet_paragraphs(doc, [(f'{title}: ', desc) for title, desc in short_term], bold_lead=True)
     
     doc.add_paragraph()
     
@@ -2171,11 +2300,7 @@ def add_recommendations(doc, increased_services):
          'Use AWS Compute Optimizer to identify and right-size over-provisioned resources.'),
     ]
     
-    for title, desc in long_term:
-        para = doc.add_paragraph()
-        run = para.add_run(f'• {title}: ')
-        run.font.bold = True
-        para.add_run(desc)
+    add_bullet_paragraphs(doc, [(f'{title}: ', desc) for title, desc in long_term], bold_lead=True)
     
     doc.add_page_break()
 
@@ -2190,107 +2315,162 @@ def add_appendix(doc, increased_services, month_names):
     )
     
     if increased_services:
-        table = doc.add_table(rows=len(increased_services) + 2, cols=5)
+        table = doc.add_table(rows=1, cols=5)
         format_data_table(table)
         
         # Headers
         headers = ['Service', month_names[0], month_names[-1], 'Increase', '% Change']
-        for i, header in enumerate(headers):
-            cell = table.rows[0].cells[i]
-            cell.text = header
-            format_cell(cell, bold=True, bg_color='333333', font_color='FFFFFF',
-                       font_size=9, align='center')
+        format_header_row(table.rows[0], headers, '333333', font_size=9)
         
         # Data
-        total_prev = 0
-        total_curr = 0
-        total_change = 0
-        
-        for row_idx, svc in enumerate(increased_services, 1):
-            row = table.rows[row_idx]
-            
-            row.cells[0].text = truncate_service_name(svc['service'])
-            format_cell(row.cells[0], font_size=9, align='left')
-            
-            row.cells[1].text = f"${svc['previous_cost']:,.2f}"
-            format_cell(row.cells[1], font_size=9, align='right')
-            
-            row.cells[2].text = f"${svc['current_cost']:,.2f}"
-            format_cell(row.cells[2], font_size=9, align='right')
-            
-            row.cells[3].text = f"${svc['change']:,.2f}"
-            format_cell(row.cells[3], font_size=9, align='right')
-            
-            row.cells[4].text = f"{svc['pct_change']:.1f}%"
-            format_cell(row.cells[4], font_size=9, align='center')
-            
-            total_prev += svc['previous_cost']
-            total_curr += svc['current_cost']
-            total_change += svc['change']
-        
-        # Totals row
-        totals_row = table.rows[-1]
-        totals_row.cells[0].text = 'TOTAL'
-        format_cell(totals_row.cells[0], bold=True, bg_color='333333', 
-                   font_color='FFFFFF', font_size=9, align='left')
-        
-        totals_row.cells[1].text = f"${total_prev:,.2f}"
-        format_cell(totals_row.cells[1], bold=True, bg_color='333333',
-                   font_color='FFFFFF', font_size=9, align='right')
+        data_rows = [
+            (
+                truncate_service_name(svc['service']),
+                f"${svc['previous_cost']:,.2f}",
+                f"${svc['current_cost']:,.2f}",
+                f"${svc['change']:,.2f}",
+                f"{svc['pct_change']:.1f}%"
+            )
+            for svc in increased_services
+        ]
         
-        totals_row.cells[2].text = f"${total_curr:,.2f}"
-        format_cell(totals_row.cells[2], bold=True, bg_color='333333',
-                   font_color='FFFFFF', font_size=9, align='right')
+        total_prev = sum(svc['previous_cost'] for svc in increased_services)
+        total_curr = sum(svc['current_cost'] for svc in increased_services)
+        total_change = sum(svc['change'] for svc in increased_services)
         
-        totals_row.cells[3].text = f"${total_change:,.2f}"
-        format_cell(totals_row.cells[3], bold=True, bg_color='333333',
-                   font_color='FFFFFF', font_size=9, align='right')
+        aligns = ('left', 'right', 'right', 'right', 'center')
+        append_table_rows(table, data_rows, aligns, font_size=9)
         
-        totals_row.cells[4].text = ''
-        format_cell(totals_row.cells[4], bg_color='333333')
+        # Totals row
+        totals = ('TOTAL', f"${total_prev:,.2f}", f"${total_curr:,.2f}", f"${total_change:,.2f}", '')
+        append_table_rows(table, [totals], aligns, bold=True, bg_color='333333',
+                          font_color='FFFFFF', font_size=9)
 
 
 # ===== HELPER FUNCTIONS =====
 
-def format_cell(cell, bold=False, bg_color=None, font_color=None, 
-                font_size=11, align='left'):
-    """Format a table cell with consistent styling."""
-    # Set vertical alignment
+def set_font(target, name=None, size=None, bold=None, color=None):
+    """Apply font settings to a run or style through a single Font lookup."""
+    font = target.font
+    if name is not None:
+        font.name = name
+    if size is not None:
+        font.size = Pt(size)
+    if bold is not None:
+        font.bold = bold
+    if color is not None:
+        font.color.rgb = color
+
+
+def fill_cell(cell, text, bold=False, bg_color=None, font_color=None,
+              font_size=11, align='left'):
+    """Set a table cell's text and styling in one step.
+    
+    Produces the same markup as assigning cell.text and then styling its
+    paragraph and run, but builds the paragraph as a single XML fragment
+    instead of going through python-docx's paragraph and run wrappers.
+    """
     cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
-    
-    # Format paragraph
-    for paragraph in cell.paragraphs:
-        paragraph.paragraph_format.space_before = Pt(4)
-        paragraph.paragraph_format.space_after = Pt(4)
-        
-        if align == 'center':
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        elif align == 'right':
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        else:
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        
-        for run in paragraph.runs:
-            run.font.name = 'Calibri'
-            run.font.size = Pt(font_size)
-            run.font.bold = bold
-            if font_color:
-                # Parse hex color string to RGB
-                r = int(font_color[0:2], 16)
-                g = int(font_color[2:4], 16)
-                b = int(font_color[4:6], 16)
-                run.font.color.rgb = RGBColor(r, g, b)
-    
-    # Set background color
     if bg_color:
         set_cell_shading(cell, bg_color)
+    
+    tc = cell._tc
+    tc.clear_content()
+    tc.append(parse_xml(cell_paragraph_xml(text, bold, font_color, font_size, align,
+                                           ns=' ' + nsdecls('w'))))
+
+
+def cell_paragraph_xml(text, bold, font_color, font_size, align, ns=''):
+    """Return the CELL_PARAGRAPH_XML markup for a cell text."""
+    return CELL_PARAGRAPH_XML.format(
+        ns=ns,
+        align=align if align in ('center', 'right') else 'left',
+        bold='<w:b/>' if bold else '<w:b w:val="0"/>',
+        color=f'<w:color w:val="{font_color.upper()}"/>' if font_color else '',
+        size=int(font_size * 2),
+        text=run_text_xml(text)
+    )
+
+
+def run_text_xml(text):
+    """Return the run content markup for text.
+    
+    Tabs and line breaks become <w:tab/> and <w:br/> elements, as they do when
+    python-docx assigns run text.
+    """
+    return ''.join(RUN_CONTENT_XML.get(part) or text_element_xml(part)
+                   for part in RUN_CONTENT_SPLIT.split(text) if part)
+
+
+def text_element_xml(text):
+    """Return a <w:t> element for text, preserving leading and trailing spaces."""
+    if text[0].isspace() or text[-1].isspace():
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+    return f'<w:t>{escape(text)}</w:t>'
+
+
+def append_table_rows(table, rows, aligns, bold=False, bg_color=None, font_color=None,
+                      font_size=11):
+    """Append rows of cell texts to a table in one XML parse.
+    
+    Cells are styled as fill_cell would style them, with one alignment per
+    column. A cell is either its text or a dict holding 'text' and any of
+    'bold', 'bg_color' and 'font_color' to override the row styling. Building
+    the <w:tr> markup directly avoids creating empty rows with doc.add_table
+    and then walking them cell by cell.
+    """
+    tbl = table._tbl
+    widths = [grid_col.get(qn('w:w')) for grid_col in tbl.tblGrid.gridCol_lst]
+    
+    def cell_xml(cell, width, align):
+        if isinstance(cell, str):
+            text, cell_bold, cell_bg, cell_color = cell, bold, bg_color, font_color
+        else:
+            text = cell['text']
+            cell_bold = cell.get('bold', bold)
+            cell_bg = cell.get('bg_color', bg_color)
+            cell_color = cell.get('font_color', font_color)
+        return CELL_XML.format(
+            width=width,
+            shading=f'<w:shd w:fill="{cell_bg}"/>' if cell_bg else '',
+            paragraph=cell_paragraph_xml(text, cell_bold, cell_color, font_size, align)
+        )
+    
+    rows_xml = ''.join(
+        '<w:tr>' + ''.join(cell_xml(cell, width, align)
+                           for cell, width, align in zip(row, widths, aligns)) + '</w:tr>'
+        for row in rows
+    )
+    tbl.extend(list(parse_xml(TABLE_ROWS_XML.format(rows=rows_xml))))
+
+
+def table_row_cells(table):
+    """Return the cells of every row, reading the table XML once.
+    
+    python-docx's row.cells rebuilds the cell grid of the whole table on each
+    access, so filling a table row by row through it is quadratic. The report
+    tables have no merged cells, so each <w:tc> maps to exactly one cell.
+    """
+    return [[_Cell(tc, table) for tc in tr.tc_lst] for tr in table._tbl.tr_lst]
+
+
+def format_header_row(row, labels, bg_color, font_size=9):
+    """Fill a table header row, applying the same header style to every cell."""
+    for cell, label in zip(row.cells, labels):
+        fill_cell(cell, label, bold=True, bg_color=bg_color, font_color='FFFFFF',
+                  font_size=font_size, align='center')
+
+
+# One <w:shd> element per fill color, copied into each shaded cell
+shading_element_cache = {}
 
 
 def set_cell_shading(cell, color):
     """Set background color for a table cell."""
-    shading = OxmlElement('w:shd')
-    shading.set(qn('w:fill'), color)
-    cell._tc.get_or_add_tcPr().append(shading)
+    shading = shading_element_cache.get(color)
+    if shading is None:
+        shading = shading_element_cache[color] = OxmlElement('w:shd', {qn('w:fill'): color})
+    cell._tc.get_or_add_tcPr().append(deepcopy(shading))
 
 
 def format_data_table(table):
@@ -2298,18 +2478,14 @@ def format_data_table(table):
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
     
     # Set table borders
+    set_table_borders(table, DATA_TABLE_BORDERS)
+
+
+def set_table_borders(table, borders):
+    """Add a copy of a parsed <w:tblBorders> element to a table's properties."""
     tbl = table._tbl
     tblPr = tbl.tblPr if tbl.tblPr is not None else OxmlElement('w:tblPr')
-    tblBorders = OxmlElement('w:tblBorders')
-    
-    for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
-        border = OxmlElement(f'w:{border_name}')
-        border.set(qn('w:val'), 'single')
-        border.set(qn('w:sz'), '4')
-        border.set(qn('w:color'), 'CCCCCC')
-        tblBorders.append(border)
-    
-    tblPr.append(tblBorders)
+    tblPr.append(deepcopy(borders))
     if tbl.tblPr is None:
         tbl.insert(0, tblPr)
 
@@ -2318,10 +2494,12 @@ def format_metrics_table(table):
     """Format the key metrics table."""
     format_data_table(table)
     
-    # Set column widths
-    for row in table.rows:
-        for cell in row.cells:
-            cell.width = Inches(1.5)
+    # Set column widths - writes each cell's <w:tcW> as cell.width would, in a
+    # single pass over the table XML
+    width = str(METRICS_COLUMN_WIDTH.twips)
+    for tc_width in table._tbl.iter(qn('w:tcW')):
+        tc_width.set(qn('w:type'), 'dxa')
+        tc_width.set(qn('w:w'), width)
 
 
 def format_inline_stats_table(table):
@@ -2329,49 +2507,13 @@ def format_inline_stats_table(table):
     table.alignment = WD_TABLE_ALIGNMENT.LEFT
     
     # Remove borders for inline stats
-    tbl = table._tbl
-    tblPr = tbl.tblPr if tbl.tblPr is not None else OxmlElement('w:tblPr')
-    tblBorders = OxmlElement('w:tblBorders')
-    
-    for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
-        border = OxmlElement(f'w:{border_name}')
-        border.set(qn('w:val'), 'single')
-        border.set(qn('w:sz'), '2')
-        border.set(qn('w:color'), 'DDDDDD')
-        tblBorders.append(border)
-    
-    tblPr.append(tblBorders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tblPr)
+    set_table_borders(table, INLINE_TABLE_BORDERS)
 
 
 def add_info_box(doc, title, content, bg_color):
     """Add an information box with background."""
-    table = doc.add_table(rows=1, cols=1)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    cell = table.rows[0].cells[0]
-    
-    # Title
-    title_para = cell.paragraphs[0]
-    run = title_para.add_run(title)
-    run.font.bold = True
-    run.font.size = Pt(10)
-    run.font.color.rgb = RGBColor(0, 51, 102)
-    
-    # Content
-    content_para = cell.add_paragraph(content)
-    content_para.paragraph_format.space_before = Pt(8)
-    
-    # Background
-    set_cell_shading(cell, 'E8F4FC')
-    
-    # Padding
-    cell.paragraphs[0].paragraph_format.space_before = Pt(12)
-    cell.paragraphs[-1].paragraph_format.space_after = Pt(12)
-    
-    for para in cell.paragraphs:
-        para.paragraph_format.left_indent = Inches(0.15)
-        para.paragraph_format.right_indent = Inches(0.15)
+    # RGBColor objects convert to hex strings
+    add_box(doc, title, content, str(bg_color), COLOR_NAVY, title_size=10)
 
 
 def add_alert_box(doc, title, content, bg_color, title_color):
@@ -2384,34 +2526,54 @@ def add_alert_box(doc, title, content, bg_color, title_color):
         bg_color: Background color (RGBColor object)
         title_color: Title text color (RGBColor object)
     """
-    table = doc.add_table(rows=1, cols=1)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    cell = table.rows[0].cells[0]
-    
-    # Title
-    title_para = cell.paragraphs[0]
-    run = title_para.add_run(title)
-    run.font.bold = True
-    run.font.size = Pt(12)
-    run.font.color.rgb = title_color
-    
-    # Content
-    content_para = cell.add_paragraph(content)
-    content_para.paragraph_format.space_before = Pt(8)
-    
-    # Background color - RGBColor object converts to hex string
-    hex_color = str(bg_color)
-    set_cell_shading(cell, hex_color)
-    
-    # Padding
-    cell.paragraphs[0].paragraph_format.space_before = Pt(12)
-    cell.paragraphs[-1].paragraph_format.space_after = Pt(12)
+    # RGBColor objects convert to hex strings
+    add_box(doc, title, content, str(bg_color), title_color, title_size=12)
+
+
+def add_box(doc, title, content, fill, title_color, title_size):
+    """Append a shaded single-cell box table with a bold title and content paragraph.
     
-    for para in cell.paragraphs:
-        para.paragraph_format.left_indent = Inches(0.15)
-        para.paragraph_format.right_indent = Inches(0.15)
+    The table is written from BOX_XML in one parse, producing the same markup
+    as doc.add_table plus the paragraph, shading and indent settings it used to
+    apply cell by cell.
+    """
+    box = parse_xml(BOX_XML.format(
+        width=doc._block_width.twips,
+        fill=fill,
+        title_color=str(title_color),
+        title_size=title_size * 2,
+        title=run_text_xml(title),
+        content=f'<w:r>{run_text_xml(content)}</w:r>' if content else ''
+    ))
+    doc.element.body._insert_tbl(box)
+
+
+def add_bullet_paragraphs(doc, items, indent=None, bold_lead=False):
+    """Append bullet paragraphs to the document body in one XML parse.
+    
+    Each item is a (lead, text) pair. The lead follows the bullet in the first
+    run, bold when bold_lead is set, and the text forms a second run. The
+    paragraphs are inserted before the final section properties, as
+    doc.add_paragraph would place them.
+    """
+    ppr = f'<w:pPr><w:ind w:left="{indent.twips}"/></w:pPr>' if indent is not None else ''
+    rpr = '<w:rPr><w:b/></w:rPr>' if bold_lead else ''
+    paragraphs = parse_xml(BODY_XML.format(content=''.join(
+        f'<w:p>{ppr}<w:r>{rpr}{text_element_xml("• " + lead)}</w:r>'
+        f'<w:r>{run_text_xml(text)}</w:r></w:p>'
+        for lead, text in items
+    )))
+    
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for paragraph in list(paragraphs):
+        if sect_pr is not None:
+            sect_pr.addprevious(paragraph)
+        else:
+            body.append(paragraph)
 
 
+@lru_cache(maxsize=1024)
 def truncate_service_name(name, max_len=40):
     """Truncate long service names."""
     if len(name) <= max_len:
@@ -2419,129 +2581,132 @@ def truncate_service_name(name, max_len=40):
     return name[:max_len-3] + '...'
 
 
+@lru_cache(maxsize=1024)
 def simplify_usage_type(usage_type):
     """Simplify AWS usage type names."""
-    if ':' in usage_type:
-        parts = usage_type.split(':')
-        if len(parts) > 1 and parts[-1]:
-            result = parts[-1]
-            if len(result) > 35:
-                return result[:32] + '...'
-            return result
-    if len(usage_type) > 35:
-        return usage_type[:32] + '...'
-    return usage_type
+    # Keep the part after the last colon, e.g. 'USE1-BoxUsage:t3.large' -> 't3.large'
+    _, _, suffix = usage_type.rpartition(':')
+    name = suffix or usage_type
+    return name if len(name) <= 35 else name[:32] + '...'
+
+
+# Likely cost drivers by service keyword, checked in this order against the
+# service name: (primary driver, usage changes)
+SERVICE_DRIVERS = {
+    'EC2': (
+        'Increased compute instance usage, instance type scaling, or extended runtime hours',
+        ('Additional EC2 instances provisioned or upgraded to larger instance types',
+         'Instances running for extended hours or 24/7 instead of scheduled hours',
+         'Data transfer costs associated with EC2 instances increased')
+    ),
+    'S3': (
+        'Increased storage volume, data transfer, or API request volume',
+        ('Storage volume growth from new data uploads',
+         'Increased data transfer (cross-region or internet egress)',
+         'Higher API request volume (GET, PUT, LIST operations)')
+    ),
+    'RDS': (
+        'Database instance scaling, storage growth, or increased IOPS',
+        ('Database instance upgraded to larger instance class',
+         'Storage auto-scaling triggered by data growth',
+         'Increased provisioned IOPS or Multi-AZ deployment')
+    ),
+    'Lambda': (
+        'Increased function invocations, duration, or memory allocation',
+        ('Higher number of function invocations from increased traffic',
+         'Longer function execution times due to processing complexity',
+         'Memory allocation increases affecting cost per invocation')
+    ),
+    'CloudWatch': (
+        'Increased logging, metrics collection, or dashboard usage',
+        ('Log ingestion volume increased significantly',
+         'Additional custom metrics or high-resolution metrics enabled',
+         'More frequent API calls or additional CloudWatch dashboards')
+    ),
+}
+SERVICE_DRIVERS['Transfer'] = SERVICE_DRIVERS['CloudFront'] = (
+    'Increased data transfer volume or CDN usage',
+    ('Higher data egress to internet or cross-region',
+     'Increased CDN traffic and cache invalidations',
+     'Cross-AZ or cross-region data movement increased')
+)
+DEFAULT_SERVICE_DRIVER = (
+    'Increased service usage and resource consumption',
+    ('Service usage volume increased during the analysis period',
+     'Resource configuration changes may have impacted costs',
+     'API call volume or data processing increased')
+)
+
+
+def service_keyword(service):
+    """Return the first SERVICE_DRIVERS keyword found in a service name, or None."""
+    return next((keyword for keyword in SERVICE_DRIVERS if keyword in service), None)
 
 
 def analyze_service_drivers(svc):
     """Analyze cost drivers for a service."""
-    service = svc['service']
+    primary_driver, usage_changes = SERVICE_DRIVERS.get(service_keyword(svc['service']),
+                                                        DEFAULT_SERVICE_DRIVER)
     
-    result = {
-        'primary_driver': 'Increased service usage and resource consumption',
-        'usage_changes': [],
+    return {
+        'primary_driver': primary_driver,
+        'usage_changes': list(usage_changes),
         'recommendations': []
     }
-    
-    if 'EC2' in service:
-        result['primary_driver'] = 'Increased compute instance usage, instance type scaling, or extended runtime hours'
-        result['usage_changes'] = [
-            'Additional EC2 instances provisioned or upgraded to larger instance types',
-            'Instances running for extended hours or 24/7 instead of scheduled hours',
-            'Data transfer costs associated with EC2 instances increased'
-        ]
-    elif 'S3' in service:
-        result['primary_driver'] = 'Increased storage volume, data transfer, or API request volume'
-        result['usage_changes'] = [
-            'Storage volume growth from new data uploads',
-            'Increased data transfer (cross-region or internet egress)',
-            'Higher API request volume (GET, PUT, LIST operations)'
-        ]
-    elif 'RDS' in service:
-        result['primary_driver'] = 'Database instance scaling, storage growth, or increased IOPS'
-        result['usage_changes'] = [
-            'Database instance upgraded to larger instance class',
-            'Storage auto-scaling triggered by data growth',
-            'Increased provisioned IOPS or Multi-AZ deployment'
-        ]
-    elif 'Lambda' in service:
-        result['primary_driver'] = 'Increased function invocations, duration, or memory allocation'
-        result['usage_changes'] = [
-            'Higher number of function invocations from increased traffic',
-            'Longer function execution times due to processing complexity',
-            'Memory allocation increases affecting cost per invocation'
-        ]
-    elif 'CloudWatch' in service:
-        result['primary_driver'] = 'Increased logging, metrics collection, or dashboard usage'
-        result['usage_changes'] = [
-            'Log ingestion volume increased significantly',
-            'Additional custom metrics or high-resolution metrics enabled',
-            'More frequent API calls or additional CloudWatch dashboards'
-        ]
-    elif 'Transfer' in service or 'CloudFront' in service:
-        result['primary_driver'] = 'Increased data transfer volume or CDN usage'
-        result['usage_changes'] = [
-            'Higher data egress to internet or cross-region',
-            'Increased CDN traffic and cache invalidations',
-            'Cross-AZ or cross-region data movement increased'
-        ]
-    else:
-        result['usage_changes'] = [
-            'Service usage volume increased during the analysis period',
-            'Resource configuration changes may have impacted costs',
-            'API call volume or data processing increased'
-        ]
-    
-    return result
+
+
+# Follow-up guidance for the detailed service analysis, by service keyword
+SERVICE_REASONS = {
+    'EC2': ("This typically indicates additional compute capacity, larger instances, or extended running hours. "
+            "Consider reviewing instance utilization and implementing auto-scaling or scheduled shutdowns."),
+    'S3': ("This suggests increased storage consumption or data transfer activity. "
+           "Review bucket sizes, implement lifecycle policies, and optimize data transfer patterns."),
+    'RDS': ("This may reflect database scaling, storage growth, or IOPS increases. "
+            "Evaluate instance right-sizing and consider Reserved Instances for stable workloads."),
+    'Lambda': ("This indicates higher function invocations or longer execution times. "
+               "Optimize function code and review memory allocation settings."),
+}
+DEFAULT_SERVICE_REASON = "Review the specific usage patterns for this service to identify optimization opportunities."
+
+# Severity labels by percentage increase, highest threshold first
+SEVERITY_LEVELS = ((100, 'dramatic'), (50, 'significant'), (20, 'notable'))
 
 
 def generate_detailed_reason(svc, changes):
     """Generate detailed reason for cost increase."""
     service = svc['service']
     pct = svc['pct_change']
+    severity = next((label for threshold, label in SEVERITY_LEVELS if pct > threshold), 'moderate')
     
-    if pct > 100:
-        severity = 'dramatic'
-    elif pct > 50:
-        severity = 'significant'
-    elif pct > 20:
-        severity = 'notable'
-    else:
-        severity = 'moderate'
-    
-    reason = f"The {severity} cost increase of {pct:.1f}% for {truncate_service_name(service)} "
+    parts = [f"The {severity} cost increase of {pct:.1f}% for {truncate_service_name(service)} "]
     
     if changes:
         top = changes[0]
-        reason += f"is primarily attributed to '{simplify_usage_type(top['usage_type'])}', "
-        reason += f"which grew from ${top['previous']:,.2f} to ${top['current']:,.2f} "
-        reason += f"(+${top['change']:,.2f}). "
-    
-    if 'EC2' in service:
-        reason += "This typically indicates additional compute capacity, larger instances, or extended running hours. "
-        reason += "Consider reviewing instance utilization and implementing auto-scaling or scheduled shutdowns."
-    elif 'S3' in service:
-        reason += "This suggests increased storage consumption or data transfer activity. "
-        reason += "Review bucket sizes, implement lifecycle policies, and optimize data transfer patterns."
-    elif 'RDS' in service:
-        reason += "This may reflect database scaling, storage growth, or IOPS increases. "
-        reason += "Evaluate instance right-sizing and consider Reserved Instances for stable workloads."
-    elif 'Lambda' in service:
-        reason += "This indicates higher function invocations or longer execution times. "
-        reason += "Optimize function code and review memory allocation settings."
-    else:
-        reason += "Review the specific usage patterns for this service to identify optimization opportunities."
+        parts.append(f"is primarily attributed to '{simplify_usage_type(top['usage_type'])}', "
+                     f"which grew from ${top['previous']:,.2f} to ${top['current']:,.2f} "
+                     f"(+${top['change']:,.2f}). ")
+    
+    parts.append(SERVICE_REASONS.get(service_keyword(service), DEFAULT_SERVICE_REASON))
     
-    return reason
+    return ''.join(parts)
 
 
 def generate_immediate_actions(increased_services):
     """Generate immediate action recommendations."""
     actions = []
     
-    ec2_services = [s for s in increased_services if 'EC2' in s['service']]
-    if ec2_services:
-        total = sum(s['change'] for s in ec2_services)
+    # Classify every service in one pass; a service can count towards both
+    ec2_changes = []
+    storage_changes = []
+    for svc in increased_services:
+        service = svc['service']
+        if 'EC2' in service:
+            ec2_changes.append(svc['change'])
+        if 'S3' in service or 'EBS' in service:
+            storage_changes.append(svc['change'])
+    
+    if ec2_changes:
+        total = sum(ec2_changes)
         actions.append({
             'title': 'Audit EC2 Instance Usage',
             'description': f'EC2-related costs increased by ${total:,.2f}. Perform immediate review.',
@@ -2552,9 +2717,8 @@ def generate_immediate_actions(increased_services):
             ]
         })
     
-    storage_services = [s for s in increased_services if 'S3' in s['service'] or 'EBS' in s['service']]
-    if storage_services:
-        total = sum(s['change'] for s in storage_services)
+    if storage_changes:
+        total = sum(storage_changes)
         actions.append({
             'title': 'Review Storage Resources',
             'description': f'Storage costs increased by ${total:,.2f}. Audit storage utilization.',
@@ -2591,11 +2755,10 @@ COMPUTE_PATTERNS = [
     ('NodeUsage:', 'ElastiCache'),
     ('Node:', 'Redshift'),
 ]
+COMPUTE_USAGE_RE = re.compile('|'.join(re.escape(pattern) for pattern, _ in COMPUTE_PATTERNS))
 
 
+@lru_cache(maxsize=4096)
 def is_compute_usage_type(usage_type):
     """Check if usage type is compute resource."""
-    for pattern, _ in COMPUTE_PATTERNS:
-        if pattern in usage_type:
-            return True
-    return False
+    return COMPUTE_USAGE_RE.search(usage_type) is not None